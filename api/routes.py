@@ -10,7 +10,7 @@ from llm_clients import create_llm_clients
 from services import (
     get_landing_page_metrics,
     get_or_compute_metrics,
-    send_slack_notification,
+    send_slack_notification_async,
 )
 from utils.logger import get_logger
 
@@ -136,12 +136,15 @@ def create_brand_insight_request():
 
         logger.info(f"Brand insight request recorded for {brand_name} ({email})")
 
-        # Send Slack notification (fire-and-forget, don't fail request if Slack fails)
-        send_slack_notification(
+        # Send Slack notification in the background (fire-and-forget, don't
+        # delay or fail the request if Slack is slow or down)
+        send_slack_notification_async(
+            executor=current_app.config["SLACK_EXECUTOR"],
             webhook_url=settings.slack_webhook_url,
             brand_name=brand_name,
             email=email,
             logger=logger,
+            session=current_app.config["SLACK_SESSION"],
         )
 
         return (
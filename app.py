@@ -1,11 +1,15 @@
 """Flask application factory."""
 
-import logging
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Flask, g
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from config import Settings, get_settings
 from db import create_engine_from_url
+from services.slack_service import create_slack_session
+from utils.logger import configure_logging
 
 
 def create_app(settings: Settings | None = None) -> Flask:
@@ -31,16 +35,23 @@ def create_app(settings: Settings | None = None) -> Flask:
     app.config["DEBUG"] = settings.debug
 
     # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    configure_logging(settings.log_level)
 
     # Setup database
     engine = create_engine_from_url(settings.database_url)
     session_factory = sessionmaker(bind=engine)
     app.config["DB_SESSION"] = scoped_session(session_factory)
 
+    # Setup pooled HTTP session and background workers for Slack notifications
+    slack_session = create_slack_session()
+    app.config["SLACK_SESSION"] = slack_session
+    atexit.register(slack_session.close)
+    slack_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="slack")
+    app.config["SLACK_EXECUTOR"] = slack_executor
+    # Registered last so it runs first at exit, letting queued notifications
+    # finish before the session closes
+    atexit.register(slack_executor.shutdown)
+
     # Setup request context for DB session
     @app.before_request
     def before_request():
@@ -82,7 +93,6 @@ app = create_app()
 
 
 if __name__ == "__main__":
-    app = create_app()
     settings = app.config["SETTINGS"]
     app.run(
         host="0.0.0.0",
@@ -0,0 +1,31 @@
+"""Compile hot pure-Python modules to C extensions with mypyc.
+
+Usage:
+    python build_mypyc.py
+
+Builds the extensions in place (e.g. services/llm_query_service.*.so), which
+Python then imports in preference to the .py source. The public API of the
+compiled modules is unchanged; deleting the .so files falls back to the
+interpreted source. Requires mypy, setuptools and a C compiler.
+"""
+
+from mypyc.build import mypycify
+from setuptools import setup
+
+# Modules compiled ahead of time (LLM response parsing runs once per
+# LLM x prompt on every pipeline run)
+MYPYC_MODULES = [
+    "services/llm_query_service.py",
+]
+
+
+if __name__ == "__main__":
+    setup(
+        name="brank-backend-mypyc",
+        packages=[],
+        ext_modules=mypycify(
+            # Only the compiled modules need to type-check cleanly
+            ["--follow-imports=silent", "--ignore-missing-imports", *MYPYC_MODULES]
+        ),
+        script_args=["build_ext", "--inplace"],
+    )
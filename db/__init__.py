@@ -1,11 +1,18 @@
 """Database initialization and setup."""
 
+import json
+from functools import partial
+
 from sqlalchemy import create_engine as sa_create_engine
 from sqlalchemy.orm import declarative_base
 
 # Base class for all models
 Base = declarative_base()
 
+# Compact JSON for JSON columns (brands_list, citation_list, citations_list):
+# no padding after separators, so less to build and send per row
+_json_serializer = partial(json.dumps, separators=(",", ":"))
+
 
 def create_engine_from_url(database_url: str):
     """Create SQLAlchemy engine from database URL.
@@ -21,6 +28,7 @@ def create_engine_from_url(database_url: str):
         return sa_create_engine(
             database_url,
             echo=False,
+            json_serializer=_json_serializer,
         )
 
     # PostgreSQL/MySQL with connection pooling
@@ -30,5 +38,6 @@ def create_engine_from_url(database_url: str):
         pool_size=10,  # Connection pool size
         max_overflow=20,  # Max connections beyond pool_size
         echo=False,  # Don't log SQL queries (set True for debugging)
+        json_serializer=_json_serializer,
     )
 
@@ -2,13 +2,24 @@
 
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
-from sqlalchemy import func
+from typing import Any, List, Optional, Dict
+from sqlalchemy import Insert, func, lambda_stmt, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from db.models import Metric, Brand
 
 
+# Columns refreshed when an upsert hits an existing (brand_id, llm_name) row
+_UPSERT_COLUMNS = (
+    "mention_rate",
+    "citations_list",
+    "sentiment_score",
+    "brand_rank",
+    "updated_at",
+)
+
+
 class MetricsRepository:
     """Data access layer for Metric model."""
 
@@ -100,6 +111,55 @@ class MetricsRepository:
 
         return metric
 
+    @staticmethod
+    def upsert_many(
+        db_session: Session, rows: List[Dict[str, Any]]
+    ) -> List[Metric]:
+        """Create or update several metrics in a single statement.
+
+        Uses INSERT ... ON CONFLICT (brand_id, llm_name) DO UPDATE on
+        PostgreSQL and SQLite; other dialects fall back to one upsert per row.
+
+        Args:
+            db_session: Database session
+            rows: Dicts with brand_id, llm_name, mention_rate, citations_list,
+                sentiment_score and brand_rank (one per brand/LLM pair)
+
+        Returns:
+            Metric instances (created or updated)
+        """
+        if not rows:
+            return []
+
+        now = datetime.utcnow()
+        values = [{**row, "created_at": now, "updated_at": now} for row in rows]
+        conflict_columns = [Metric.brand_id, Metric.llm_name]
+
+        stmt: Insert
+        dialect_name = db_session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            pg_stmt = postgresql.insert(Metric).values(values)
+            stmt = pg_stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={name: pg_stmt.excluded[name] for name in _UPSERT_COLUMNS},
+            )
+        elif dialect_name == "sqlite":
+            sqlite_stmt = sqlite.insert(Metric).values(values)
+            stmt = sqlite_stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={name: sqlite_stmt.excluded[name] for name in _UPSERT_COLUMNS},
+            )
+        else:
+            return [MetricsRepository.upsert(db_session, **row) for row in rows]
+
+        # populate_existing refreshes Metric objects already in the session
+        return list(
+            db_session.scalars(
+                stmt.returning(Metric),
+                execution_options={"populate_existing": True},
+            )
+        )
+
     @staticmethod
     def get_by_brand(db_session: Session, brand_id: uuid.UUID) -> List[Metric]:
         """Get all metrics for a brand.
@@ -111,7 +171,10 @@ class MetricsRepository:
         Returns:
             List of Metric instances
         """
-        return db_session.query(Metric).filter(Metric.brand_id == brand_id).all()
+        # lambda_stmt caches the compiled SQL keyed on the lambda's code, so
+        # this hot cache-check query is only compiled once per process
+        stmt = lambda_stmt(lambda: select(Metric).where(Metric.brand_id == brand_id))
+        return list(db_session.execute(stmt).scalars().all())
 
     @staticmethod
     def get_fresh_metrics(
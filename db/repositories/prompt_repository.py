@@ -3,10 +3,11 @@
 import uuid
 from typing import List, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import Select, func, insert, select
 from sqlalchemy.orm import Session, selectinload
 
 from db.models import Brand, Prompt
+from utils.batching import chunked
 
 
 class PromptRepository:
@@ -31,22 +32,32 @@ class PromptRepository:
 
     @staticmethod
     def create_bulk(
-        db_session: Session, brand_id: uuid.UUID, prompts: List[str]
+        db_session: Session,
+        brand_id: uuid.UUID,
+        prompts: List[str],
+        batch_size: int = 500,
     ) -> List[Prompt]:
-        """Create multiple prompts.
+        """Create multiple prompts with batched INSERT ... RETURNING.
+
+        Uses an ORM bulk insert, so each batch is written in one statement
+        and the returned Prompt instances come from RETURNING rather than a
+        per-row flush or follow-up SELECT.
 
         Args:
             db_session: Database session
             brand_id: Brand UUID
             prompts: List of prompt texts
+            batch_size: Maximum rows per INSERT statement
 
         Returns:
-            List of created Prompt instances
+            List of created Prompt instances, in input order
         """
-        prompt_objs = [Prompt(brand_id=brand_id, prompt=p) for p in prompts]
-        db_session.add_all(prompt_objs)
-        db_session.flush()
-        return prompt_objs
+        stmt = insert(Prompt).returning(Prompt, sort_by_parameter_order=True)
+        created: List[Prompt] = []
+        for batch in chunked(prompts, batch_size):
+            rows = [{"brand_id": brand_id, "prompt": p} for p in batch]
+            created.extend(db_session.scalars(stmt, rows))
+        return created
 
     @staticmethod
     def get_prompt_texts_for_brand(
@@ -59,12 +70,14 @@ class PromptRepository:
             brand_id: Brand UUID
 
         Returns:
-            List of prompt text strings
+            List of prompt text strings, sorted so the order is deterministic
         """
-        prompts = (
-            db_session.query(Prompt.prompt).filter(Prompt.brand_id == brand_id).all()
+        stmt: Select[Tuple[str]] = (
+            select(Prompt.prompt)
+            .where(Prompt.brand_id == brand_id)
+            .order_by(Prompt.prompt)
         )
-        return [p[0] for p in prompts]
+        return list(db_session.scalars(stmt))
 
     @staticmethod
     def get_prompts_paginated(
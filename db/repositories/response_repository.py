@@ -1,10 +1,12 @@
 """Repository for Response model operations."""
 
 import uuid
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
-from db.models import Response
+from db.models import Prompt, Response
+from utils.batching import chunked
 
 
 class ResponseRepository:
@@ -43,6 +45,34 @@ class ResponseRepository:
         db_session.flush()
         return response
 
+    @staticmethod
+    def create_bulk(
+        db_session: Session,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 500,
+    ) -> int:
+        """Create multiple responses with batched INSERTs.
+
+        Uses an ORM bulk insert, so no Response instances are built or
+        tracked by the session; query them back if needed. Rows are pulled
+        and inserted ``batch_size`` at a time, so a generator of rows is
+        never materialized in full.
+
+        Args:
+            db_session: Database session
+            rows: Dicts with prompt_id, llm_name, answer, brands_list and
+                citation_list (one per response)
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of responses created
+        """
+        created = 0
+        for batch in chunked(rows, batch_size):
+            db_session.execute(insert(Response), batch)
+            created += len(batch)
+        return created
+
     @staticmethod
     def get_by_prompt_and_llm(
         db_session: Session, prompt_id: uuid.UUID, llm_name: str
@@ -77,8 +107,6 @@ class ResponseRepository:
         Returns:
             List of Response instances
         """
-        from db.models import Prompt
-
         return (
             db_session.query(Response)
             .join(Prompt)
@@ -99,8 +127,6 @@ class ResponseRepository:
         Returns:
             List of Response instances
         """
-        from db.models import Prompt
-
         return (
             db_session.query(Response)
             .join(Prompt)
@@ -108,3 +134,47 @@ class ResponseRepository:
             .all()
         )
 
+    @staticmethod
+    def iter_batches_by_brand(
+        db_session: Session, brand_id: uuid.UUID, batch_size: int = 500
+    ) -> Iterator[Sequence[Response]]:
+        """Stream all responses for a brand across all LLMs in batches.
+
+        Rows are fetched ``batch_size`` at a time instead of being
+        materialized up front, so single-pass consumers only hold one batch
+        of Response objects in memory at a time.
+
+        Args:
+            db_session: Database session
+            brand_id: Brand UUID
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Batches of up to ``batch_size`` Response instances
+        """
+        stmt = (
+            select(Response)
+            .join(Prompt)
+            .where(Prompt.brand_id == brand_id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from db_session.scalars(stmt).partitions()
+
+    @staticmethod
+    def iter_by_brand(
+        db_session: Session, brand_id: uuid.UUID, batch_size: int = 1000
+    ) -> Iterator[Response]:
+        """Stream all responses for a brand across all LLMs one at a time.
+
+        Args:
+            db_session: Database session
+            brand_id: Brand UUID
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Response instances
+        """
+        for batch in ResponseRepository.iter_batches_by_brand(
+            db_session, brand_id, batch_size
+        ):
+            yield from batch
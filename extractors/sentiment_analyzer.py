@@ -2,45 +2,11 @@
 
 import re
 import logging
-from typing import List
+from typing import List, Tuple
 
-
-def analyze_sentiment(
-    text: str, brand_name: str, logger: logging.Logger | None = None
-) -> float:
-    """Analyze sentiment toward a brand in text.
-    
-    This is a simple heuristic-based approach using positive/negative word counts.
-    In production, consider using:
-    - TextBlob or VADER for better accuracy
-    - LLM-based sentiment analysis for even better results
-    - Fine-tuned sentiment models
-    
-    Args:
-        text: Text to analyze
-        brand_name: Brand name to analyze sentiment for
-        logger: Optional logger instance
-        
-    Returns:
-        Sentiment score from 0 (very negative) to 100 (very positive)
-        50 is neutral
-        
-    Example:
-        >>> analyze_sentiment("Samsung makes great phones!", "Samsung")
-        75.0
-    """
-    if logger is None:
-        logger = logging.getLogger(__name__)
-
-    # Extract sentences mentioning the brand
-    sentences = extract_brand_sentences(text, brand_name)
-
-    if not sentences:
-        logger.debug(f"No sentences mentioning {brand_name}, returning neutral")
-        return 50.0  # Neutral if brand not mentioned
-
-    # Positive and negative word lists
-    positive_words = {
+# Positive and negative word lists
+POSITIVE_WORDS = frozenset(
+    {
         "good",
         "great",
         "excellent",
@@ -67,8 +33,10 @@ def analyze_sentiment(
         "favorite",
         "better",
     }
+)
 
-    negative_words = {
+NEGATIVE_WORDS = frozenset(
+    {
         "bad",
         "poor",
         "terrible",
@@ -87,23 +55,90 @@ def analyze_sentiment(
         "buggy",
         "slow",
         "outdated",
-        "disappointing",
         "worse",
         "issues",
         "problems",
         "defective",
     }
+)
+
+# Whole words; a lexicon word matches exactly when it is one of these tokens
+_WORD_RE = re.compile(r"\w+")
+
+# Sentence boundaries (simple approach)
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+
+def analyze_sentiment(
+    text: str, brand_name: str, logger: logging.Logger | None = None
+) -> float:
+    """Analyze sentiment toward a brand in text.
+    
+    This is a simple heuristic-based approach using positive/negative word counts.
+    In production, consider using:
+    - TextBlob or VADER for better accuracy
+    - LLM-based sentiment analysis for even better results
+    - Fine-tuned sentiment models
+    
+    Args:
+        text: Text to analyze
+        brand_name: Brand name to analyze sentiment for
+        logger: Optional logger instance
+        
+    Returns:
+        Sentiment score from 0 (very negative) to 100 (very positive)
+        50 is neutral
+        
+    Example:
+        >>> analyze_sentiment("Samsung makes great phones!", "Samsung")
+        75.0
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    # Extract sentences mentioning the brand
+    sentences = _brand_sentences_lower(text, brand_name.lower())
+
+    if not sentences:
+        logger.debug(f"No sentences mentioning {brand_name}, returning neutral")
+        return 50.0  # Neutral if brand not mentioned
 
-    # Count positive and negative words in relevant sentences
-    text_lower = " ".join(sentences).lower()
-    positive_count = sum(1 for word in positive_words if re.search(r"\b" + word + r"\b", text_lower))
-    negative_count = sum(1 for word in negative_words if re.search(r"\b" + word + r"\b", text_lower))
+    positive_count, negative_count = _count_sentiment_words(sentences)
 
     logger.debug(
         f"Sentiment for {brand_name}: +{positive_count} positive, -{negative_count} negative"
     )
 
-    # Calculate score
+    return _sentiment_score(positive_count, negative_count)
+
+
+def _count_sentiment_words(sentences: List[str]) -> Tuple[int, int]:
+    """Count distinct positive and negative words in the given sentences.
+
+    Args:
+        sentences: Lowercased sentences mentioning the brand
+
+    Returns:
+        Tuple of (positive_count, negative_count)
+    """
+    # Tokenize once and intersect with both lexicons (hash lookups per token)
+    # rather than running a regex alternation over the text per lexicon
+    tokens = _WORD_RE.findall(" ".join(sentences))
+    positive_count = len(POSITIVE_WORDS.intersection(tokens))
+    negative_count = len(NEGATIVE_WORDS.intersection(tokens))
+    return positive_count, negative_count
+
+
+def _sentiment_score(positive_count: int, negative_count: int) -> float:
+    """Turn positive/negative word counts into a 0-100 sentiment score.
+
+    Args:
+        positive_count: Number of distinct positive words
+        negative_count: Number of distinct negative words
+
+    Returns:
+        Sentiment score from 0 (very negative) to 100 (very positive)
+    """
     if positive_count == 0 and negative_count == 0:
         return 50.0  # Neutral
 
@@ -142,14 +177,31 @@ def extract_brand_sentences(text: str, brand_name: str) -> List[str]:
     Returns:
         List of sentences mentioning the brand
     """
+    return _extract_brand_sentences(text, brand_name.lower())
+
+
+def _extract_brand_sentences(text: str, brand_lower: str) -> List[str]:
+    """Extract sentences that mention an already-lowercased brand name."""
     # Split into sentences (simple approach)
-    sentences = re.split(r"[.!?]+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
     # Find sentences mentioning brand (case-insensitive)
-    brand_lower = brand_name.lower()
     relevant_sentences = [
         s.strip() for s in sentences if brand_lower in s.lower() and s.strip()
     ]
 
     return relevant_sentences
 
+
+def _brand_sentences_lower(text: str, brand_lower: str) -> List[str]:
+    """Like _extract_brand_sentences, but returns the sentences lowercased.
+
+    Scoring only needs lowercase text, so the whole text is lowercased once
+    up front instead of once per sentence for the brand check and again for
+    the word count.
+    """
+    return [
+        s.strip()
+        for s in _SENTENCE_SPLIT_RE.split(text.lower())
+        if brand_lower in s and s.strip()
+    ]
@@ -1,10 +1,18 @@
 """LLM client implementations."""
 
-from llm_clients.base import LLMClient, LLMError, LLMTimeoutError, LLMAPIError, LLMRateLimitError
+from llm_clients.base import (
+    LLMClient,
+    JSONModeLLMClient,
+    LLMError,
+    LLMTimeoutError,
+    LLMAPIError,
+    LLMRateLimitError,
+)
 from llm_clients.factory import create_llm_clients
 
 __all__ = [
     "LLMClient",
+    "JSONModeLLMClient",
     "LLMError",
     "LLMTimeoutError",
     "LLMAPIError",
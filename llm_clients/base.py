@@ -1,6 +1,6 @@
 """Base LLM client protocol and exceptions."""
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 from abc import abstractmethod
 
 
@@ -61,3 +61,30 @@ class LLMClient(Protocol):
         """
         ...
 
+
+@runtime_checkable
+class JSONModeLLMClient(LLMClient, Protocol):
+    """Protocol for LLM clients that can constrain their output to JSON.
+
+    Optional capability: callers check ``isinstance(client, JSONModeLLMClient)``
+    and fall back to ``query`` plus text parsing otherwise.
+    """
+
+    @abstractmethod
+    def query_json(self, prompt: str, timeout: int = 30) -> str:
+        """Send prompt to LLM and return a response that is a JSON object.
+
+        The prompt itself must describe the expected JSON shape.
+
+        Args:
+            prompt: Question/prompt to send to LLM
+            timeout: Maximum seconds to wait for response
+
+        Returns:
+            Response text (a JSON object)
+
+        Raises:
+            LLMTimeoutError: If request times out
+            LLMAPIError: If API returns an error
+        """
+        ...
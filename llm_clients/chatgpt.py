@@ -2,7 +2,9 @@
 
 import logging
 import time
+from typing import Any
 from openai import OpenAI, OpenAIError, APITimeoutError, RateLimitError
+from openai.types.chat import ChatCompletion
 from llm_clients.base import LLMError, LLMTimeoutError, LLMAPIError, LLMRateLimitError
 from utils.retry import retry_with_backoff
 
@@ -28,9 +30,6 @@ class ChatGPTClient:
         """Return LLM name."""
         return "chatgpt"
 
-    @retry_with_backoff(
-        max_attempts=3, min_wait=2, max_wait=10, exceptions=(APITimeoutError,)
-    )
     def query(self, prompt: str, timeout: int = 30) -> str:
         """Send prompt to ChatGPT and return response.
 
@@ -46,18 +45,49 @@ class ChatGPTClient:
             LLMRateLimitError: If rate limit is hit
             LLMAPIError: If API returns an error
         """
+        return self._complete(prompt, timeout)
+
+    def query_json(self, prompt: str, timeout: int = 30) -> str:
+        """Send prompt to ChatGPT in JSON mode and return response.
+
+        The response is guaranteed to be a JSON object; the prompt must
+        mention JSON and describe the expected shape.
+
+        Args:
+            prompt: Question/prompt to send
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Response text from ChatGPT (a JSON object)
+
+        Raises:
+            LLMTimeoutError: If request times out
+            LLMRateLimitError: If rate limit is hit
+            LLMAPIError: If API returns an error
+        """
+        return self._complete(
+            prompt, timeout, response_format={"type": "json_object"}
+        )
+
+    @retry_with_backoff(
+        max_attempts=3, min_wait=2, max_wait=10, exceptions=(APITimeoutError,)
+    )
+    def _complete(self, prompt: str, timeout: int, **create_kwargs: Any) -> str:
+        """Run one chat completion, mapping OpenAI errors to LLM errors."""
         start_time = time.time()
         try:
             self.logger.debug(f"[ChatGPT] Querying with prompt length: {len(prompt)}")
 
-            response = self.client.chat.completions.create(
+            response: ChatCompletion = self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 timeout=timeout,
                 temperature=0.7,
+                **create_kwargs,
             )
 
-            answer = response.choices[0].message.content
+            # content is None for refusals/tool calls; callers expect text
+            answer = response.choices[0].message.content or ""
             elapsed = time.time() - start_time
 
             self.logger.info(
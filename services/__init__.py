@@ -2,11 +2,17 @@
 
 from services.metric_service import get_or_compute_metrics
 from services.landing_page_service import get_landing_page_metrics
-from services.slack_service import send_slack_notification
+from services.slack_service import (
+    create_slack_session,
+    send_slack_notification,
+    send_slack_notification_async,
+)
 
 __all__ = [
     "get_or_compute_metrics",
     "get_landing_page_metrics",
+    "create_slack_session",
     "send_slack_notification",
+    "send_slack_notification_async",
 ]
 
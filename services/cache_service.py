@@ -2,7 +2,7 @@
 
 import logging
 import uuid
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, cast
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -35,16 +35,10 @@ def check_cache(
     # Fetch all metrics for the brand (regardless of age)
     metrics = MetricsRepository.get_by_brand(db_session, brand_id)
 
-    # Check if all active LLMs have metrics
-    llm_names = {m.llm_name for m in metrics}
-    required_llms = set(active_llm_names)
-
-    if not required_llms.issubset(llm_names):
-        logger.info("Cache miss - some LLMs missing metrics, need to recompute")
-        return None
-
-    # Convert to response format
+    # Single pass: collect LLM names, build the response format and track the
+    # oldest updated_at (used for computed_at) together
     result = {}
+    oldest_update: Optional[datetime] = None
     for metric in metrics:
         result[metric.llm_name] = {
             "brandRank": metric.brand_rank,
@@ -52,10 +46,14 @@ def check_cache(
             "mentionRate": metric.mention_rate,
             "sentimentScore": metric.sentiment_score,
         }
+        updated_at = cast(datetime, metric.updated_at)
+        if oldest_update is None or updated_at < oldest_update:
+            oldest_update = updated_at
 
-    # Get the oldest updated_at for computed_at
-    oldest_update = min(m.updated_at for m in metrics)
+    # Check if all active LLMs have metrics
+    if oldest_update is None or not set(active_llm_names).issubset(result):
+        logger.info("Cache miss - some LLMs missing metrics, need to recompute")
+        return None
 
     logger.info(f"Cache hit! Last computed: {oldest_update}")
     return {"metrics": result, "computed_at": oldest_update.isoformat(), "cached": True}
-
@@ -1,12 +1,26 @@
 """LLM query service for parallel queries."""
 
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from llm_clients.base import LLMClient, LLMError, LLMRateLimitError
 
+# Separates the answer from the trailing brands/citations JSON block
+_EXTRACTION_MARKER = "JSON_EXTRACTION:"
+
+# (brands, citations) as extracted from an LLM response's JSON block
+ParsedExtraction = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+# LRU of parsed extractions keyed by a 16-byte digest of the JSON block
+_PARSE_CACHE_SIZE = 1024
+_parse_cache: "OrderedDict[bytes, ParsedExtraction]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
 
 def query_llms_parallel(
     prompts: List[str],
@@ -165,65 +179,95 @@ JSON_EXTRACTION:
 
     # Make single LLM call
     response = client.query(combined_prompt, timeout=timeout)
+    marker_pos = response.find(_EXTRACTION_MARKER)
 
     # Parse the response to extract answer and JSON
     try:
-        # Split by JSON_EXTRACTION marker
-        if "JSON_EXTRACTION:" in response:
-            parts = response.split("JSON_EXTRACTION:", 1)
-            answer = parts[0].strip()
-            json_part = parts[1].strip()
+        if marker_pos != -1:
+            answer = response[:marker_pos].strip()
+            json_part = response[marker_pos + len(_EXTRACTION_MARKER) :].strip()
         else:
             # Fallback: try to find JSON in the response
             answer = response
             json_part = response
 
-        # Extract JSON (handle markdown code blocks)
-        json_text = json_part
-        if "```json" in json_text:
-            start = json_text.find("```json") + 7
-            end = json_text.find("```", start)
-            json_text = json_text[start:end].strip()
-        elif "```" in json_text:
-            start = json_text.find("```") + 3
-            end = json_text.find("```", start)
-            json_text = json_text[start:end].strip()
-
-        # Find first { and last }
-        start_idx = json_text.find("{")
-        end_idx = json_text.rfind("}") + 1
-        if start_idx != -1 and end_idx > start_idx:
-            json_text = json_text[start_idx:end_idx]
-
-        # Parse JSON
-        data = json.loads(json_text)
-        brands_list = data.get("brands", [])
-        citation_list = data.get("citations", [])
-
-        # Clean and deduplicate
-        brands_clean = []
-        seen_brands = set()
-        for brand in brands_list:
-            brand = str(brand).strip()
-            if brand and brand.lower() not in seen_brands:
-                brands_clean.append(brand)
-                seen_brands.add(brand.lower())
-
-        citations_clean = []
-        seen_citations = set()
-        for citation in citation_list:
-            citation = str(citation).strip()
-            if citation and citation.lower() not in seen_citations:
-                citations_clean.append(citation)
-                seen_citations.add(citation.lower())
+        brands_clean, citations_clean = _parse_extraction(json_part)
 
         logger.debug(
             f"{client.name} single-call extraction: {len(brands_clean)} brands, {len(citations_clean)} citations"
         )
-        return answer, brands_clean, citations_clean
+        return answer, list(brands_clean), list(citations_clean)
 
     except Exception as e:
         logger.warning(f"Failed to parse JSON from {client.name} response: {e}")
         # Fallback: return answer without extraction
         return response, [], []
 
+
+def _parse_extraction(json_part: str) -> ParsedExtraction:
+    """Parse and clean the brands/citations JSON block of an LLM response.
+
+    Successful parses are memoized by a digest of the JSON block, so
+    identical extractions (common across retries) skip the JSON work.
+
+    Args:
+        json_part: Response text following the extraction marker
+
+    Returns:
+        Tuple of (brands, citations)
+
+    Raises:
+        ValueError: If no valid JSON block can be parsed
+    """
+    key = hashlib.blake2b(json_part.encode(), digest_size=16).digest()
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+            return cached
+
+    # Extract JSON (handle markdown code blocks)
+    json_text = json_part
+    if "```json" in json_text:
+        start = json_text.find("```json") + 7
+        end = json_text.find("```", start)
+        json_text = json_text[start:end].strip()
+    elif "```" in json_text:
+        start = json_text.find("```") + 3
+        end = json_text.find("```", start)
+        json_text = json_text[start:end].strip()
+
+    # Find first { and last }
+    start_idx = json_text.find("{")
+    end_idx = json_text.rfind("}") + 1
+    if start_idx != -1 and end_idx > start_idx:
+        json_text = json_text[start_idx:end_idx]
+
+    # Parse JSON
+    data = json.loads(json_text)
+    brands_list = data.get("brands", [])
+    citation_list = data.get("citations", [])
+
+    # Clean and deduplicate
+    brands_clean = []
+    seen_brands = set()
+    for brand in brands_list:
+        brand = str(brand).strip()
+        if brand and brand.lower() not in seen_brands:
+            brands_clean.append(brand)
+            seen_brands.add(brand.lower())
+
+    citations_clean = []
+    seen_citations = set()
+    for citation in citation_list:
+        citation = str(citation).strip()
+        if citation and citation.lower() not in seen_citations:
+            citations_clean.append(citation)
+            seen_citations.add(citation.lower())
+
+    parsed = (tuple(brands_clean), tuple(citations_clean))
+    with _parse_cache_lock:
+        _parse_cache[key] = parsed
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return parsed
@@ -82,7 +82,10 @@ def get_or_compute_metrics(
     # Derive brand name from website for new brands (e.g. "browserstack.com" -> "Browserstack")
     brand_name = website.split(".")[0].capitalize()
 
-    # Look up by website (case-insensitive), create if not found
+    # Look up by website (case-insensitive), create if not found.
+    # Commit the brand right away so it is not held uncommitted (and locking
+    # the unique website index) for the whole pipeline; the pipeline's
+    # prompt, response and metric writes are committed together at the end.
     brand = BrandRepository.get_or_create(db_session, brand_name, website)
     db_session.commit()
 
@@ -117,7 +120,7 @@ def get_or_compute_metrics(
                     per_llm_metrics[llm_name]["brandDomainCitationRate"] = citation_rate
 
         # Calculate all brands ranking
-        all_responses = ResponseRepository.get_by_brand(db_session, brand.brand_id)
+        all_responses = ResponseRepository.iter_by_brand(db_session, brand.brand_id)
         all_brands_ranking = calculate_all_brands_ranking(all_responses, logger)
 
         # Aggregate metrics
@@ -188,7 +191,7 @@ def get_or_compute_metrics(
     timings["aggregation_time"] = t5.elapsed
     logger.info(f"Step 5 complete in {t5.elapsed:.2f}s: Metrics aggregation")
 
-    # Store timing profile
+    # Store timing profile and commit all pipeline writes in one transaction
     profile = TimeProfile(
         brand_id=brand.brand_id,
         request_id=request_id,
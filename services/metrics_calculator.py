@@ -1,10 +1,12 @@
 """Metrics calculation service."""
 
+import heapq
 import logging
 import math
 import uuid
-from typing import List, Dict, Optional
-from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Dict, Optional
+from collections import defaultdict
 from sqlalchemy.orm import Session
 
 from db.repositories import ResponseRepository, MetricsRepository
@@ -39,18 +41,58 @@ def calculate_and_store_metrics(
     """
     logger.info(f"Calculating metrics for brand {brand_name}")
 
-    metrics_result = {}
+    normalized_brand = normalize_brand_name(brand_name)
+    website_lower = website.lower()
+    aggregates_by_llm = {llm_name: _MetricAggregates() for llm_name in llm_names}
+    brand_totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    total_responses = 0
+    # First error per LLM; a malformed response fails only its own LLM
+    failed_llms: Dict[str, str] = {}
+
+    # Stream the brand's responses once, folding each batch into the per-LLM
+    # aggregates and the cross-LLM brand totals so only counters (not the
+    # Response objects and their answers) outlive the batch
+    for batch in ResponseRepository.iter_batches_by_brand(db_session, brand_id):
+        for response in batch:
+            llm_name = str(response.llm_name)
+            try:
+                ranks = _brand_ranks(response)
+                aggregates = aggregates_by_llm.get(llm_name)
+                if aggregates is not None and llm_name not in failed_llms:
+                    _add_to_aggregates(
+                        aggregates,
+                        response,
+                        ranks,
+                        brand_name,
+                        normalized_brand,
+                        website_lower,
+                        logger,
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Failed to process response {response.response_id} "
+                    f"from {llm_name}: {e}"
+                )
+                failed_llms.setdefault(llm_name, str(e))
+                continue
+
+            total_responses += 1
+            _add_brand_totals(brand_totals, ranks)
 
-    for llm_name in llm_names:
+    metrics_result = {}
+    pending_rows = []
+    for llm_name, aggregates in aggregates_by_llm.items():
         logger.info(f"Calculating metrics for {llm_name}")
 
         try:
-            # Get all responses for this brand and LLM
-            responses = ResponseRepository.get_by_brand_and_llm(
-                db_session, brand_id, llm_name
-            )
+            if llm_name in failed_llms:
+                metrics_result[llm_name] = {
+                    "error": failed_llms[llm_name],
+                    "status": "failed",
+                }
+                continue
 
-            if not responses:
+            if not aggregates.total_responses:
                 logger.warning(f"No responses found for {llm_name}")
                 metrics_result[llm_name] = {
                     "error": "No responses available",
@@ -59,40 +101,29 @@ def calculate_and_store_metrics(
                 continue
 
             # Calculate 5 metrics (4 original + brand domain citation rate)
-            brand_rank = calculate_brand_rank(brand_name, responses, logger)
-            citations_list = calculate_citations_list(responses, logger)
-            mention_rate = calculate_mention_rate(brand_name, responses, logger)
-            sentiment_score = calculate_sentiment_score(
-                brand_name, responses, logger
-            )
-            brand_domain_citation_rate = calculate_brand_domain_citation_rate(
-                website, responses, logger
-            )
-
-            # Store in database (upsert) - keep original 4 metrics
-            MetricsRepository.upsert(
-                db_session=db_session,
-                brand_id=brand_id,
-                llm_name=llm_name,
-                mention_rate=mention_rate,
-                citations_list=citations_list,
-                sentiment_score=sentiment_score,
-                brand_rank=brand_rank,
+            metrics = _metrics_from_aggregates(aggregates, logger)
+
+            # Queue for the database upsert - keep original 4 metrics
+            pending_rows.append(
+                {
+                    "brand_id": brand_id,
+                    "llm_name": llm_name,
+                    "mention_rate": metrics["mentionRate"],
+                    "citations_list": metrics["citationsList"],
+                    "sentiment_score": metrics["sentimentScore"],
+                    "brand_rank": metrics["brandRank"],
+                }
             )
 
             # Store in result - include new metric
-            metrics_result[llm_name] = {
-                "brandRank": brand_rank,
-                "citationsList": citations_list,
-                "mentionRate": mention_rate,
-                "sentimentScore": sentiment_score,
-                "brandDomainCitationRate": brand_domain_citation_rate,
-            }
+            metrics_result[llm_name] = metrics
 
             logger.info(
-                f"{llm_name} metrics: rank={brand_rank}, mention_rate={mention_rate}, "
-                f"sentiment={sentiment_score}, citations={len(citations_list)}, "
-                f"brand_domain_citation={brand_domain_citation_rate}"
+                f"{llm_name} metrics: rank={metrics['brandRank']}, "
+                f"mention_rate={metrics['mentionRate']}, "
+                f"sentiment={metrics['sentimentScore']}, "
+                f"citations={len(metrics['citationsList'])}, "
+                f"brand_domain_citation={metrics['brandDomainCitationRate']}"
             )
 
         except Exception as e:
@@ -102,18 +133,143 @@ def calculate_and_store_metrics(
                 "status": "failed",
             }
 
-    # Commit metrics
-    db_session.commit()
+    # Store all LLMs' metrics in one statement; the pipeline commits the
+    # whole request together
+    MetricsRepository.upsert_many(db_session, pending_rows)
     logger.info("Metrics calculation complete")
 
-    # Calculate all brands ranking across all LLMs
+    # Rank all brands across all LLMs from the totals gathered above
     logger.info("Calculating all brands ranking across all LLMs")
-    all_responses = ResponseRepository.get_by_brand(db_session, brand_id)
-    all_brands_ranking = calculate_all_brands_ranking(all_responses, logger)
+    all_brands_ranking = _rank_brands(brand_totals, total_responses, logger)
 
     return metrics_result, all_brands_ranking
 
 
+@dataclass
+class _MetricAggregates:
+    """Raw per-LLM aggregates, updated one response at a time."""
+
+    # Number of responses folded in so far
+    total_responses: int = 0
+    # 1-based rank of the brand in each response that mentions it
+    ranks: List[int] = field(default_factory=list)
+    # Sentiment score of each response mentioning the brand
+    sentiments: List[float] = field(default_factory=list)
+    # Number of responses citing each domain (counted once per response)
+    domain_counter: Dict[str, int] = field(default_factory=dict)
+    # Number of responses citing a URL that contains the brand domain
+    brand_domain_citations: int = 0
+    # Last response index each domain was counted for (see _count_domains)
+    last_seen: Dict[str, int] = field(default_factory=dict)
+
+
+def _add_to_aggregates(
+    aggregates: _MetricAggregates,
+    response: Response,
+    ranks: Dict[str, int],
+    brand_name: str,
+    normalized_brand: str,
+    website_lower: str,
+    logger: logging.Logger,
+) -> None:
+    """Fold one response into an LLM's aggregates.
+
+    Args:
+        aggregates: Aggregates to update
+        response: Response object
+        ranks: The response's brand ranks (see _brand_ranks)
+        brand_name: Brand name, for sentiment analysis
+        normalized_brand: Normalized brand name to find
+        website_lower: Lowercased brand website matched against citation URLs
+        logger: Logger instance
+    """
+    _count_domains(
+        aggregates.domain_counter,
+        aggregates.last_seen,
+        aggregates.total_responses,
+        response.citation_list,
+    )
+    aggregates.total_responses += 1
+
+    if _cites_brand_domain(response.citation_list, website_lower):
+        aggregates.brand_domain_citations += 1
+
+    rank = ranks.get(normalized_brand)
+    if rank is None:
+        return
+    aggregates.ranks.append(rank)
+
+    score = _score_sentiment(response.answer, brand_name, logger)
+    if score is not None:
+        aggregates.sentiments.append(score)
+
+
+def _cites_brand_domain(citation_list: List[str], website_lower: str) -> bool:
+    """Check whether any cited URL contains the (lowercased) brand website.
+
+    The URLs are joined and lowercased once so the check is a single
+    C-level substring search per response rather than a lower() and search
+    per URL. Newline never occurs in a website, so a match cannot span two
+    URLs.
+
+    Args:
+        citation_list: The response's cited URLs
+        website_lower: Lowercased brand website (e.g., "samsung.com")
+
+    Returns:
+        True if at least one URL contains the website
+    """
+    if not citation_list:
+        return False
+    return website_lower in "\n".join(citation_list).lower()
+
+
+def _metrics_from_aggregates(
+    aggregates: _MetricAggregates, logger: logging.Logger
+) -> Dict[str, Any]:
+    """Derive the five metrics for one LLM from its aggregates.
+
+    Args:
+        aggregates: Aggregates over a non-empty set of responses
+        logger: Logger instance
+
+    Returns:
+        Metrics dict (brandRank, citationsList, mentionRate, sentimentScore,
+        brandDomainCitationRate)
+    """
+    total = aggregates.total_responses
+    ranks = aggregates.ranks
+
+    return {
+        "brandRank": round(sum(ranks) / len(ranks), 2) if ranks else None,
+        "citationsList": _top_domains(aggregates.domain_counter, total, logger),
+        "mentionRate": round(len(ranks) / total, 3),
+        "sentimentScore": _average_sentiment(aggregates.sentiments, logger),
+        "brandDomainCitationRate": round(
+            aggregates.brand_domain_citations / total * 100, 1
+        ),
+    }
+
+
+def _brand_ranks(response: Response) -> Dict[str, int]:
+    """Map each normalized brand in a response to its 1-based rank.
+
+    Only the first occurrence of a brand counts. Brand normalization is
+    memoized (see normalize_brand_name), so rebuilding the map per metric
+    is a handful of dict operations.
+
+    Args:
+        response: Response object
+
+    Returns:
+        Dictionary mapping normalized brand name to 1-based rank
+    """
+    ranks: Dict[str, int] = {}
+    for position, brand in enumerate(response.brands_list, start=1):
+        ranks.setdefault(normalize_brand_name(brand), position)
+    return ranks
+
+
 def calculate_brand_rank(
     brand_name: str, responses: List[Response], logger: logging.Logger
 ) -> Optional[float]:
@@ -131,12 +287,9 @@ def calculate_brand_rank(
     ranks = []
 
     for response in responses:
-        # Normalize all brands in the list
-        normalized_brands = [normalize_brand_name(b) for b in response.brands_list]
-
         # Find brand position (1-based)
-        if normalized_brand in normalized_brands:
-            rank = normalized_brands.index(normalized_brand) + 1
+        rank = _brand_ranks(response).get(normalized_brand)
+        if rank is not None:
             ranks.append(rank)
 
     if not ranks:
@@ -152,7 +305,7 @@ def calculate_brand_rank(
 
 def calculate_citations_list(
     responses: List[Response], logger: logging.Logger
-) -> List[Dict[str, float]]:
+) -> List[Dict[str, Any]]:
     """Calculate top 5 domains by citation percentage.
     
     URLs are normalized to domain level before counting.
@@ -166,29 +319,62 @@ def calculate_citations_list(
     Returns:
         List of {url, percentage} dicts (top 5 domains)
     """
-    domain_counter = Counter()
+    domain_counter: Dict[str, int] = {}
+    last_seen: Dict[str, int] = {}
     total_responses = len(responses)
 
-    for response in responses:
-        # Normalize URLs to domains and deduplicate within response
-        domains_in_response = set()
-        for url in response.citation_list:
-            domain = extract_domain(url)
-            domains_in_response.add(domain)
-        
-        domain_counter.update(domains_in_response)
+    for index, response in enumerate(responses):
+        _count_domains(domain_counter, last_seen, index, response.citation_list)
 
-    # Calculate percentages
-    citations = [
-        {"url": domain, "percentage": round((count / total_responses) * 100, 1)}
-        for domain, count in domain_counter.items()
-    ]
+    return _top_domains(domain_counter, total_responses, logger)
+
+
+def _count_domains(
+    domain_counter: Dict[str, int],
+    last_seen: Dict[str, int],
+    index: int,
+    citation_list: List[str],
+) -> None:
+    """Count each domain cited by one response once.
+
+    URLs are normalized to domains. ``last_seen`` records the index of the
+    last response each domain was counted for, which dedupes domains within
+    a response without building a set per response.
+
+    Args:
+        domain_counter: Number of responses citing each domain (updated)
+        last_seen: Last response index counted per domain (updated)
+        index: Index of this response among those being counted
+        citation_list: The response's cited URLs
+    """
+    for url in citation_list:
+        domain = extract_domain(url)
+        if last_seen.get(domain) != index:
+            last_seen[domain] = index
+            domain_counter[domain] = domain_counter.get(domain, 0) + 1
 
-    # Sort by percentage desc, then by count
-    citations.sort(key=lambda x: (-x["percentage"], -domain_counter[x["url"]]))
 
-    # Return top 5
-    top_5 = citations[:5]
+def _top_domains(
+    domain_counter: Dict[str, int], total_responses: int, logger: logging.Logger
+) -> List[Dict[str, Any]]:
+    """Turn per-domain response counts into the top 5 citation percentages.
+
+    Args:
+        domain_counter: Number of responses citing each domain
+        total_responses: Number of responses the counts were taken over
+        logger: Logger instance
+
+    Returns:
+        List of {url, percentage} dicts (top 5 domains)
+    """
+    # Percentage is monotonic in count, so the five most-cited domains are the
+    # top 5 by percentage; select them without sorting every domain
+    top_items = heapq.nlargest(5, domain_counter.items(), key=lambda kv: kv[1])
+
+    top_5 = [
+        {"url": domain, "percentage": round((count / total_responses) * 100, 1)}
+        for domain, count in top_items
+    ]
     logger.debug(f"Top domain citations: {top_5}")
     return top_5
 
@@ -210,8 +396,7 @@ def calculate_mention_rate(
     mentions = 0
 
     for response in responses:
-        normalized_brands = [normalize_brand_name(b) for b in response.brands_list]
-        if normalized_brand in normalized_brands:
+        if normalized_brand in _brand_ranks(response):
             mentions += 1
 
     mention_rate = mentions / len(responses) if responses else 0.0
@@ -234,28 +419,49 @@ def calculate_sentiment_score(
     """
     normalized_brand = normalize_brand_name(brand_name)
 
-    # Filter responses that mention the brand
-    relevant_responses = []
+    # Analyze sentiment for each response that mentions the brand
+    sentiments = []
     for response in responses:
-        normalized_brands = [normalize_brand_name(b) for b in response.brands_list]
-        if normalized_brand in normalized_brands:
-            relevant_responses.append(response)
+        if normalized_brand in _brand_ranks(response):
+            score = _score_sentiment(response.answer, brand_name, logger)
+            if score is not None:
+                sentiments.append(score)
 
-    if not relevant_responses:
-        logger.debug("No responses mention brand, returning neutral sentiment")
-        return 50.0
+    return _average_sentiment(sentiments, logger)
+
+
+def _score_sentiment(
+    answer: str, brand_name: str, logger: logging.Logger
+) -> Optional[float]:
+    """Score the sentiment toward the brand in one answer.
+
+    Args:
+        answer: Answer of a response that mentions the brand
+        brand_name: Brand name
+        logger: Logger instance
+
+    Returns:
+        Sentiment score, or None if the answer fails to analyze
+    """
+    try:
+        return analyze_sentiment(answer, brand_name, logger)
+    except Exception as e:
+        logger.warning(f"Failed to analyze sentiment: {e}")
+        return None
 
-    # Analyze sentiment for each relevant response
-    sentiments = []
-    for response in relevant_responses:
-        try:
-            score = analyze_sentiment(response.answer, brand_name, logger)
-            sentiments.append(score)
-        except Exception as e:
-            logger.warning(f"Failed to analyze sentiment: {e}")
-            continue
 
+def _average_sentiment(sentiments: List[float], logger: logging.Logger) -> float:
+    """Average per-response sentiment scores.
+
+    Args:
+        sentiments: Sentiment scores of responses mentioning the brand
+        logger: Logger instance
+
+    Returns:
+        Sentiment score from 0.0 to 100.0 (50.0 if nothing was scored)
+    """
     if not sentiments:
+        logger.debug("No responses mention brand, returning neutral sentiment")
         return 50.0
 
     avg_sentiment = sum(sentiments) / len(sentiments)
@@ -280,10 +486,9 @@ def calculate_brand_domain_citation_rate(
     citations_with_brand = 0
 
     for response in responses:
-        for url in response.citation_list:
-            if brand_lower in url.lower():
-                citations_with_brand += 1
-                break  # Count each response only once
+        # Count each response only once
+        if _cites_brand_domain(response.citation_list, brand_lower):
+            citations_with_brand += 1
 
     citation_rate = (citations_with_brand / len(responses) * 100) if responses else 0.0
     logger.debug(
@@ -293,43 +498,63 @@ def calculate_brand_domain_citation_rate(
 
 
 def calculate_all_brands_ranking(
-    all_responses: List[Response], logger: logging.Logger
+    all_responses: Iterable[Response], logger: logging.Logger
 ) -> Dict[str, float]:
     """Calculate average ranking for all brands across all responses.
 
+    Responses are consumed in a single pass, so a streaming iterator (see
+    ``ResponseRepository.iter_by_brand``) can be passed directly.
+
     Args:
-        all_responses: List of Response objects from all LLMs
+        all_responses: Response objects from all LLMs
         logger: Logger instance
 
     Returns:
         Dictionary mapping brand_name to average rank (1-based)
         Sorted by rank (ascending, best first)
     """
-    if not all_responses:
-        return {}
-
-    # Collect all unique brands
-    all_brands = set()
+    # Accumulate [rank sum, appearances] per brand in one pass over the responses
+    totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    total_responses = 0
     for response in all_responses:
-        for brand in response.brands_list:
-            normalized = normalize_brand_name(brand)
-            all_brands.add(normalized)
+        total_responses += 1
+        _add_brand_totals(totals, _brand_ranks(response))
+
+    return _rank_brands(totals, total_responses, logger)
+
+
+def _add_brand_totals(totals: Dict[str, List[int]], ranks: Dict[str, int]) -> None:
+    """Add one response's brand ranks to the [rank sum, appearances] totals."""
+    for brand, rank in ranks.items():
+        brand_total = totals[brand]
+        brand_total[0] += rank
+        brand_total[1] += 1
+
+
+def _rank_brands(
+    totals: Dict[str, List[int]], total_responses: int, logger: logging.Logger
+) -> Dict[str, float]:
+    """Turn per-brand [rank sum, appearances] totals into strict integer ranks.
+
+    Args:
+        totals: Rank sum and appearance count per normalized brand
+        total_responses: Number of responses the totals were taken over
+        logger: Logger instance
+
+    Returns:
+        Dictionary mapping brand_name to rank, best first
+    """
+    if not total_responses:
+        return {}
 
-    logger.debug(f"Found {len(all_brands)} unique brands across all responses")
+    logger.debug(f"Found {len(totals)} unique brands across all responses")
 
     # Calculate average rank for each brand (only include brands mentioned in at least 5% of responses)
-    min_appearances = max(1, int(len(all_responses) * 0.05))
+    min_appearances = max(1, int(total_responses * 0.05))
     rankings = {}
-    for brand in all_brands:
-        ranks = []
-        for response in all_responses:
-            normalized_brands = [normalize_brand_name(b) for b in response.brands_list]
-            if brand in normalized_brands:
-                rank = normalized_brands.index(brand) + 1
-                ranks.append(rank)
-
-        if len(ranks) >= min_appearances:
-            avg_rank = sum(ranks) / len(ranks)
+    for brand, (rank_sum, appearances) in totals.items():
+        if appearances >= min_appearances:
+            avg_rank = rank_sum / appearances
             rankings[brand] = round(avg_rank, 2)
 
     # Sort by avg position (ascending - lower is better), then assign strict integer ranks
@@ -1,21 +1,75 @@
 """Prompt generation service using ChatGPT."""
 
+import json
 import logging
 import random
+import re
 import uuid
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
-from llm_clients.base import LLMClient
+from llm_clients.base import JSONModeLLMClient, LLMClient
 from db.repositories import PromptRepository
 
 
+# Leading list numbering on a generated question ("1. ", "2) ", ...)
+_NUMBERING_RE = re.compile(r"^\s*\d+[.)]\s*")
+
+# Meta-prompt asking ChatGPT for user questions, kept as a module-level
+# template whose bound .format builds each prompt in one call
+_META_PROMPT_TEMPLATE = (
+    "Generate {count} realistic user questions where someone might ask an AI "
+    'assistant about products or services related to "{brand_name}" '
+    "(website: {website}).\n"
+    "\n"
+    "Requirements:\n"
+    "1. Questions should be natural, as a real user would ask\n"
+    "2. Questions should be diverse (different scenarios, use cases, price "
+    "points)\n"
+    '3. Do NOT mention "{brand_name}" in the questions - users don\'t know the '
+    "answer yet\n"
+    "4. Questions should be open-ended enough that multiple brands could be "
+    "relevant answers\n"
+    "5. IMPORTANT: First determine the brand's primary market/country. Then "
+    "generate questions from the perspective of a consumer in THAT market, using "
+    "local context (e.g. local currency, local competitors, region-specific "
+    "needs). For example, if the brand operates primarily in India, generate "
+    "questions an Indian consumer would ask, mentioning India explicitly.\n"
+    "{output_format}\n"
+    "\n"
+    "Now generate {count} questions for {brand_name}:"
+).format
+
+# Final meta-prompt requirement for clients without / with JSON mode
+_NUMBERED_OUTPUT_FORMAT = (
+    "6. Return ONLY the questions, one per line, numbered\n"
+    "\n"
+    "Example format:\n"
+    "1. What is the best smartphone under $500?\n"
+    "2. I need a phone with excellent camera quality. What do you recommend?"
+)
+
+_JSON_OUTPUT_FORMAT = (
+    '6. Return ONLY a JSON object of the form {"questions": ["...", "..."]}\n'
+    "\n"
+    "Example format:\n"
+    '{"questions": ["What is the best smartphone under $500?", '
+    '"I need a phone with excellent camera quality. What do you recommend?"]}'
+)
+
+
 def generate_prompts(
-    brand_name: str, website: str, count: int, chatgpt_client: LLMClient, logger: logging.Logger
+    brand_name: str,
+    website: str,
+    count: int,
+    chatgpt_client: LLMClient,
+    logger: logging.Logger,
 ) -> List[str]:
     """Generate user questions where the brand could be relevant.
     
-    Uses ChatGPT to generate realistic user queries.
+    Uses ChatGPT to generate realistic user queries. Clients supporting JSON
+    mode return the questions as a JSON array; others return a numbered list
+    that is parsed line by line.
     
     Args:
         brand_name: Name of the brand
@@ -30,41 +84,31 @@ def generate_prompts(
     Raises:
         LLMError: If prompt generation fails
     """
-    logger.info(f"Generating {count} prompts for {brand_name}")
-
-    # Create meta-prompt for ChatGPT
-    meta_prompt = f"""Generate {count} realistic user questions where someone might ask an AI assistant about products or services related to "{brand_name}" (website: {website}).
-
-Requirements:
-1. Questions should be natural, as a real user would ask
-2. Questions should be diverse (different scenarios, use cases, price points)
-3. Do NOT mention "{brand_name}" in the questions - users don't know the answer yet
-4. Questions should be open-ended enough that multiple brands could be relevant answers
-5. IMPORTANT: First determine the brand's primary market/country. Then generate questions from the perspective of a consumer in THAT market, using local context (e.g. local currency, local competitors, region-specific needs). For example, if the brand operates primarily in India, generate questions an Indian consumer would ask, mentioning India explicitly.
-6. Return ONLY the questions, one per line, numbered
+    if count <= 0:
+        # Nothing to generate; skip building the meta-prompt and the LLM call
+        return []
 
-Example format:
-1. What is the best smartphone under $500?
-2. I need a phone with excellent camera quality. What do you recommend?
-
-Now generate {count} questions for {brand_name}:"""
+    logger.info("Generating %d prompts for %s", count, brand_name)
 
     try:
-        response = chatgpt_client.query(meta_prompt, timeout=30)
-
-        # Parse response - extract numbered lines
-        prompts = []
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            # Remove numbering (1., 2., etc.)
-            if line and line[0].isdigit():
-                # Find first non-digit, non-dot, non-space character
-                for i, char in enumerate(line):
-                    if char not in "0123456789. ":
-                        prompts.append(line[i:].strip())
-                        break
-            elif line:  # Line without numbering
-                prompts.append(line)
+        prompts = None
+        if isinstance(chatgpt_client, JSONModeLLMClient):
+            meta_prompt = _build_meta_prompt(
+                brand_name, website, count, _JSON_OUTPUT_FORMAT
+            )
+            response = chatgpt_client.query_json(meta_prompt, timeout=30)
+            prompts = _parse_json_prompts(response)
+            if prompts is None:
+                logger.warning(
+                    "Prompt JSON had an unexpected shape, retrying as a numbered list"
+                )
+
+        if prompts is None:
+            meta_prompt = _build_meta_prompt(
+                brand_name, website, count, _NUMBERED_OUTPUT_FORMAT
+            )
+            response = chatgpt_client.query(meta_prompt, timeout=30)
+            prompts = _parse_numbered_prompts(response)
 
         # Ensure we have enough prompts
         if len(prompts) < count:
@@ -75,8 +119,9 @@ Now generate {count} questions for {brand_name}:"""
         # Limit to requested count
         prompts = prompts[:count]
 
-        logger.info(f"Successfully generated {len(prompts)} prompts")
-        logger.debug(f"Prompts: {prompts}")
+        logger.info("Successfully generated %d prompts", len(prompts))
+        # Lazy %-args: the list repr is only built when DEBUG is enabled
+        logger.debug("Prompts: %s", prompts)
 
         return prompts
 
@@ -85,6 +130,65 @@ Now generate {count} questions for {brand_name}:"""
         raise
 
 
+def _build_meta_prompt(
+    brand_name: str, website: str, count: int, output_format: str
+) -> str:
+    """Create the meta-prompt asking ChatGPT for user questions.
+
+    Args:
+        brand_name: Name of the brand
+        website: Brand website
+        count: Number of prompts to generate
+        output_format: Final requirement and example describing the output
+
+    Returns:
+        Meta-prompt text
+    """
+    return _META_PROMPT_TEMPLATE(
+        count=count, brand_name=brand_name, website=website, output_format=output_format
+    )
+
+
+def _parse_json_prompts(response: str) -> Optional[List[str]]:
+    """Extract questions from a JSON-mode response.
+
+    Args:
+        response: Response text, expected to be {"questions": [...]}
+
+    Returns:
+        Non-empty questions, or None if the response is not in that shape
+    """
+    try:
+        data = json.loads(response)
+    except json.JSONDecodeError:
+        return None
+
+    questions = data.get("questions") if isinstance(data, dict) else None
+    if not isinstance(questions, list):
+        return None
+
+    prompts = [q.strip() for q in questions if isinstance(q, str) and q.strip()]
+    return prompts or None
+
+
+def _parse_numbered_prompts(response: str) -> List[str]:
+    """Extract questions from a numbered-list response, one per line.
+
+    Args:
+        response: Response text
+
+    Returns:
+        Non-empty questions with their list numbering removed
+    """
+    prompts = []
+    for line in response.splitlines():
+        # Remove numbering (1., 2), etc.) and skip blank lines
+        prompt = _NUMBERING_RE.sub("", line).strip()
+        if prompt:
+            prompts.append(prompt)
+    return prompts
+
+
 def get_or_generate_prompts(
     db_session: Session,
     brand_id: uuid.UUID,
@@ -101,6 +205,9 @@ def get_or_generate_prompts(
     - If DB has < count prompts: use all existing + generate (count - existing)
     - If DB has > count prompts: randomly sample count from existing
 
+    The returned prompts are always sorted, so the same prompt set yields the
+    same order (and the same downstream queries and inserts) on every run.
+
     Args:
         db_session: Database session
         brand_id: Brand UUID
@@ -111,13 +218,15 @@ def get_or_generate_prompts(
         logger: Logger instance
 
     Returns:
-        List of prompt texts (length = count)
+        Sorted list of prompt texts (length = count)
     """
-    # Get existing prompts from DB
+    # Get existing prompts from DB (already sorted by the repository)
     existing_prompts = PromptRepository.get_prompt_texts_for_brand(db_session, brand_id)
     existing_count = len(existing_prompts)
 
-    logger.info(f"Found {existing_count} existing prompts for {brand_name}, need {count}")
+    logger.info(
+        f"Found {existing_count} existing prompts for {brand_name}, need {count}"
+    )
 
     # Case 1: Exactly the right number - use all
     if existing_count == count:
@@ -127,22 +236,24 @@ def get_or_generate_prompts(
     # Case 2: More than needed - randomly sample
     elif existing_count > count:
         logger.info(f"Randomly sampling {count} from {existing_count} existing prompts")
-        return random.sample(existing_prompts, count)
+        return sorted(random.sample(existing_prompts, count))
 
     # Case 3: Less than needed - use all + generate delta
     else:
         delta = count - existing_count
-        logger.info(f"Using {existing_count} existing prompts + generating {delta} new prompts")
+        logger.info(
+            f"Using {existing_count} existing prompts + generating {delta} new prompts"
+        )
 
         # Generate only the delta
         new_prompts = generate_prompts(brand_name, website, delta, llm_client, logger)
 
         # Store new prompts to DB
         if new_prompts:
+            # Flushed only; the pipeline commits once at the end
             PromptRepository.create_bulk(db_session, brand_id, new_prompts)
-            db_session.commit()
             logger.info(f"Stored {len(new_prompts)} new prompts to database")
 
         # Return all existing + new
-        return existing_prompts + new_prompts
+        return sorted(existing_prompts + new_prompts)
 
@@ -2,7 +2,7 @@
 
 import logging
 import uuid
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
 from sqlalchemy.orm import Session
 
 from db.repositories import PromptRepository, ResponseRepository
@@ -16,9 +16,12 @@ def process_responses(
 ) -> None:
     """Process LLM responses and store in database.
 
-    For each response:
-    1. Create prompt record
-    2. Store response record with pre-extracted brands and citations
+    Successful responses are stored with two bulk inserts:
+    1. Create one prompt record per unique prompt text
+    2. Store response records with pre-extracted brands and citations
+
+    Malformed responses are validated out before either insert, so one bad
+    row is skipped on its own instead of failing the inserts for every LLM.
 
     Note: Brands and citations are already extracted in parallel during
     the LLM query phase, so we just need to store the data.
@@ -32,52 +35,80 @@ def process_responses(
     """
     logger.info("Processing LLM responses")
 
-    # Track prompts we've already created (to avoid duplicates)
-    prompt_cache = {}  # prompt_text -> Prompt object
+    # Collect successful responses first so prompts and responses can each
+    # be stored with a single bulk insert
+    pending = []  # (llm_name, response_data)
+    prompt_texts: Dict[str, None] = {}  # unique prompt texts, first-seen order
 
     for llm_name, responses in llm_responses.items():
-        logger.info(f"Processing {len(responses)} responses from {llm_name}")
+        logger.info("Processing %d responses from %s", len(responses), llm_name)
 
         for response_data in responses:
-            prompt_text = response_data["prompt"]
-            answer = response_data["answer"]
-            brands_list = response_data["brands_list"]
-            citation_list = response_data["citation_list"]
-            error = response_data["error"]
+            answer = response_data.get("answer")
+            error = response_data.get("error")
 
             # Skip failed responses
             if error or not answer:
-                logger.warning(f"Skipping failed response for {llm_name}: {error}")
+                logger.warning("Skipping failed response for %s: %s", llm_name, error)
                 continue
 
-            # Create or get prompt
-            if prompt_text not in prompt_cache:
-                prompt = PromptRepository.create(db_session, brand_id, prompt_text)
-                prompt_cache[prompt_text] = prompt
-            else:
-                prompt = prompt_cache[prompt_text]
-
-            # Store response with pre-extracted brands and citations
-            try:
-                ResponseRepository.create(
-                    db_session=db_session,
-                    prompt_id=prompt.prompt_id,
-                    llm_name=llm_name,
-                    answer=answer,
-                    brands_list=brands_list,
-                    citation_list=citation_list,
-                )
-
-                logger.debug(
-                    f"Stored response for {llm_name}: "
-                    f"{len(brands_list)} brands, {len(citation_list)} citations"
+            problem = _invalid_response_reason(response_data)
+            if problem:
+                logger.error(
+                    "Skipping malformed response from %s: %s", llm_name, problem
                 )
-
-            except Exception as e:
-                logger.error(f"Failed to store response from {llm_name}: {e}")
                 continue
 
-    # Commit all at once
-    db_session.commit()
-    logger.info("Response processing complete")
+            prompt_texts.setdefault(response_data["prompt"])
+            pending.append((llm_name, response_data))
+
+    if not pending:
+        logger.info("Response processing complete (no successful responses)")
+        return
+
+    # One prompt row per unique prompt text (avoids duplicates across LLMs)
+    prompts = PromptRepository.create_bulk(db_session, brand_id, list(prompt_texts))
+    prompt_ids = {prompt.prompt: prompt.prompt_id for prompt in prompts}
+
+    # Store responses with pre-extracted brands and citations; rows are
+    # generated lazily and inserted in fixed-size batches
+    ResponseRepository.create_bulk(
+        db_session,
+        (
+            {
+                "prompt_id": prompt_ids[response_data["prompt"]],
+                "llm_name": llm_name,
+                "answer": response_data["answer"],
+                "brands_list": response_data["brands_list"],
+                "citation_list": response_data["citation_list"],
+            }
+            for llm_name, response_data in pending
+        ),
+    )
+
+    # Written but not committed; the pipeline commits the whole request together
+    logger.info(
+        "Response processing complete: stored %d responses for %d prompts",
+        len(pending),
+        len(prompt_ids),
+    )
+
+
+def _invalid_response_reason(response_data: Dict[str, Any]) -> Optional[str]:
+    """Check that a successful response can be stored as a row.
 
+    Args:
+        response_data: One response dict from the LLM query phase
+
+    Returns:
+        Why the response cannot be stored, or None if it is valid
+    """
+    if not isinstance(response_data.get("prompt"), str):
+        return "prompt is not a string"
+    if not isinstance(response_data.get("answer"), str):
+        return "answer is not a string"
+    for key in ("brands_list", "citation_list"):
+        values = response_data.get(key)
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            return f"{key} is not a list of strings"
+    return None
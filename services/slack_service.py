@@ -1,8 +1,70 @@
 """Slack notification service."""
 
+import json
 import logging
+from concurrent.futures import Executor, Future
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
+
+
+def create_slack_session() -> requests.Session:
+    """Create an HTTP session for Slack webhooks.
+
+    Created once by the app factory and passed to every notification, so
+    the connection to hooks.slack.com stays alive between notifications
+    instead of paying a TCP + TLS handshake per request. Connection failures
+    are retried briefly by the adapter.
+
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        ),
+    )
+    return session
+
+
+# Notification body serialized once at import; only the %-placeholders for
+# the (JSON-escaped) brand name and email are filled in per call
+_PAYLOAD_TEMPLATE = json.dumps(
+    {
+        "text": "New Brand Insight Request: %(brand_name)s (%(email)s)",
+        "blocks": [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "🎯 New Brand Insight Request",
+                    "emoji": True,
+                },
+            },
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "*Brand Name:* %(brand_name)s\n*Email:* %(email)s",
+                },
+            },
+        ],
+    }
+)
+
+
+def _json_escape(value: str) -> str:
+    """Escape a string for embedding inside a JSON string literal."""
+    return json.dumps(value)[1:-1]
+
+
+# Upper bound on how much of a failed webhook response body is read and logged
+_MAX_ERROR_BODY_BYTES = 2048
 
 
 def send_slack_notification(
@@ -11,6 +73,7 @@ def send_slack_notification(
     email: str,
     logger: logging.Logger,
     timeout: int = 10,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """Send a notification to Slack webhook about a new brand insight request.
 
@@ -20,6 +83,8 @@ def send_slack_notification(
         email: User's email address
         logger: Logger instance for logging
         timeout: Request timeout in seconds
+        session: Session to send through (see create_slack_session); a
+            one-off connection is used if omitted
 
     Returns:
         True if notification sent successfully, False otherwise
@@ -28,45 +93,37 @@ def send_slack_notification(
         logger.debug("Slack webhook URL not configured, skipping notification")
         return False
 
-    payload = {
-        "text": f"New Brand Insight Request: {brand_name} ({email})",
-        "blocks": [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🎯 New Brand Insight Request",
-                    "emoji": True,
-                },
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Brand Name:* {brand_name}\n*Email:* {email}",
-                },
-            },
-        ],
+    payload = _PAYLOAD_TEMPLATE % {
+        "brand_name": _json_escape(brand_name),
+        "email": _json_escape(email),
     }
 
     try:
-        response = requests.post(
+        # Stream so the body is only read as far as needed; the context
+        # manager closes the response on every path
+        post = session.post if session is not None else requests.post
+        with post(
             webhook_url,
-            json=payload,
+            data=payload.encode("utf-8"),
             timeout=timeout,
             headers={"Content-Type": "application/json"},
-        )
-
-        if response.status_code == 200:
-            logger.info(
-                f"Slack notification sent successfully for brand insight request: {brand_name}"
-            )
-            return True
-        else:
-            logger.warning(
-                f"Slack notification failed with status {response.status_code}: {response.text}"
-            )
-            return False
+            stream=True,
+        ) as response:
+            if response.status_code == 200:
+                # Drain Slack's tiny "ok" body so the connection can be reused
+                _ = response.content
+                logger.info(
+                    f"Slack notification sent successfully for brand insight request: {brand_name}"
+                )
+                return True
+            else:
+                # Read at most 2 KB of the error body (e.g. an HTML error page)
+                body = response.raw.read(_MAX_ERROR_BODY_BYTES, decode_content=True)
+                logger.warning(
+                    f"Slack notification failed with status {response.status_code}: "
+                    f"{body.decode('utf-8', errors='replace')}"
+                )
+                return False
 
     except requests.exceptions.Timeout:
         logger.warning("Slack notification timed out")
@@ -74,3 +131,51 @@ def send_slack_notification(
     except requests.exceptions.RequestException as e:
         logger.warning(f"Slack notification failed: {e}")
         return False
+
+
+def send_slack_notification_async(
+    executor: Executor,
+    webhook_url: str,
+    brand_name: str,
+    email: str,
+    logger: logging.Logger,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None,
+) -> "Future[bool]":
+    """Send a Slack notification in the background and return immediately.
+
+    The notification is sent by ``send_slack_notification`` on the given
+    executor, so the caller never waits on the webhook. Success and failure
+    are logged by the worker.
+
+    Args:
+        executor: Executor running background notifications (owned by the
+            app factory)
+        webhook_url: Slack webhook URL
+        brand_name: Name of the brand requested
+        email: User's email address
+        logger: Logger instance for logging
+        timeout: Request timeout in seconds
+        session: Session to send through (see create_slack_session)
+
+    Returns:
+        Future resolving to True if the notification was sent successfully
+    """
+    future = executor.submit(
+        send_slack_notification,
+        webhook_url,
+        brand_name,
+        email,
+        logger,
+        timeout,
+        session,
+    )
+    future.add_done_callback(lambda f: _log_unexpected_error(f, logger))
+    return future
+
+
+def _log_unexpected_error(future: "Future[bool]", logger: logging.Logger) -> None:
+    """Log an error raised by a background notification, if any."""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Slack notification raised unexpectedly: {error}")
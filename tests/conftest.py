@@ -4,7 +4,10 @@ import pytest
 from unittest.mock import Mock
 import logging
 
-from db.models import Response
+from sqlalchemy.orm import sessionmaker
+
+from db import Base, create_engine_from_url
+from db.models import Brand, Response
 
 
 @pytest.fixture
@@ -13,6 +16,26 @@ def mock_logger():
     return Mock(spec=logging.Logger)
 
 
+@pytest.fixture
+def db_session():
+    """Session on a fresh in-memory SQLite database."""
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def brand(db_session):
+    """Brand stored in the test database."""
+    brand = Brand(name="Samsung", website="samsung.com")
+    db_session.add(brand)
+    db_session.flush()
+    return brand
+
+
 @pytest.fixture
 def sample_responses():
     """Sample responses for testing metrics calculations."""
@@ -1,7 +1,11 @@
 """Unit tests for metrics calculator."""
 
+import uuid
 import pytest
+from unittest.mock import Mock, patch
+from db.models import Response
 from services.metrics_calculator import (
+    calculate_and_store_metrics,
     calculate_brand_rank,
     calculate_citations_list,
     calculate_mention_rate,
@@ -33,6 +37,23 @@ def test_calculate_brand_rank_not_found(sample_responses, mock_logger):
     assert rank is None
 
 
+def test_calculate_brand_rank_uses_first_occurrence(mock_logger):
+    """Test that a brand listed twice is ranked by its first position."""
+    responses = [
+        Response(
+            llm_name="chatgpt",
+            answer="Apple, Samsung and SAMSUNG™",
+            brands_list=["Apple", "Samsung", "SAMSUNG™"],
+            citation_list=[],
+        ),
+    ]
+    assert calculate_brand_rank("Samsung", responses, mock_logger) == 2.0
+    assert calculate_all_brands_ranking(responses, mock_logger) == {
+        "apple": 1,
+        "samsung": 2,
+    }
+
+
 def test_calculate_citations_list(sample_responses, mock_logger):
     """Test citations list calculation."""
     citations = calculate_citations_list(sample_responses, mock_logger)
@@ -198,3 +219,34 @@ def test_aggregate_metrics_all_llms_failed(mock_logger):
     assert "error" in result
     assert result["error"] == "All LLM requests failed"
 
+
+@patch("services.metrics_calculator.MetricsRepository.upsert_many")
+@patch("services.metrics_calculator.ResponseRepository.iter_batches_by_brand")
+def test_calculate_and_store_metrics_isolates_malformed_response(
+    mock_iter_batches, mock_upsert_many, sample_responses, mock_logger
+):
+    """Test a malformed response fails only its own LLM."""
+    malformed = Response(
+        response_id="uuid4",
+        prompt_id="prompt4",
+        llm_name="gemini",
+        answer="Samsung is fine",
+        brands_list=None,
+        citation_list=[],
+    )
+    mock_iter_batches.return_value = iter([sample_responses + [malformed]])
+
+    metrics, ranking = calculate_and_store_metrics(
+        Mock(),
+        uuid.uuid4(),
+        "Samsung",
+        "samsung.com",
+        ["chatgpt", "gemini"],
+        mock_logger,
+    )
+
+    assert metrics["gemini"]["status"] == "failed"
+    assert metrics["chatgpt"]["mentionRate"] == 0.667
+    assert list(ranking) == ["samsung", "apple", "google"]
+    stored = mock_upsert_many.call_args.args[1]
+    assert [row["llm_name"] for row in stored] == ["chatgpt"]
@@ -0,0 +1,113 @@
+"""Unit tests for prompt generation."""
+
+import json
+
+import pytest
+
+from llm_clients.base import JSONModeLLMClient
+from services.prompt_generation_service import (
+    _parse_json_prompts,
+    _parse_numbered_prompts,
+    generate_prompts,
+)
+
+NUMBERED_RESPONSE = "\n".join(
+    ["1. Best phone under $500?", "2) Best camera phone?", "", "3. Best tablet?"]
+)
+NUMBERED_PROMPTS = ["Best phone under $500?", "Best camera phone?", "Best tablet?"]
+
+
+class PlainClient:
+    """LLM client without JSON mode; records the prompts it is sent.
+
+    A plain class rather than a Mock, which would satisfy the runtime-checkable
+    JSONModeLLMClient protocol by auto-creating query_json.
+    """
+
+    name = "chatgpt"
+
+    def __init__(self, response=NUMBERED_RESPONSE):
+        self.response = response
+        self.queries = []
+
+    def query(self, prompt, timeout=30):
+        self.queries.append(prompt)
+        return self.response
+
+
+class JSONClient(PlainClient):
+    """LLM client with JSON mode."""
+
+    def __init__(self, json_response, response=NUMBERED_RESPONSE):
+        super().__init__(response)
+        self.json_response = json_response
+        self.json_queries = []
+
+    def query_json(self, prompt, timeout=30):
+        self.json_queries.append(prompt)
+        return self.json_response
+
+
+def test_client_protocol_detection():
+    """Test only clients with query_json are treated as JSON-mode clients."""
+    assert isinstance(JSONClient("{}"), JSONModeLLMClient)
+    assert not isinstance(PlainClient(), JSONModeLLMClient)
+
+
+def test_generate_prompts_json_mode(mock_logger):
+    """Test JSON-mode clients are asked for, and parsed as, a JSON object."""
+    client = JSONClient(
+        json.dumps({"questions": ["Best phone?", "  Best laptop?  ", "Best TV?"]})
+    )
+
+    prompts = generate_prompts("Samsung", "samsung.com", 2, client, mock_logger)
+
+    assert prompts == ["Best phone?", "Best laptop?"]
+    assert len(client.json_queries) == 1
+    assert '{"questions":' in client.json_queries[0]
+    assert client.queries == []
+
+
+def test_generate_prompts_plain_client_uses_numbered_list(mock_logger):
+    """Test clients without JSON mode get the numbered-list meta-prompt."""
+    client = PlainClient()
+
+    prompts = generate_prompts("Samsung", "samsung.com", 3, client, mock_logger)
+
+    assert prompts == NUMBERED_PROMPTS
+    assert len(client.queries) == 1
+    assert "numbered" in client.queries[0]
+
+
+@pytest.mark.parametrize(
+    "json_response",
+    [
+        "not json",
+        json.dumps(["Best phone?"]),
+        json.dumps({"questions": "Best phone?"}),
+        json.dumps({"prompts": ["Best phone?"]}),
+        json.dumps({"questions": ["", "   ", 42]}),
+    ],
+)
+def test_generate_prompts_falls_back_to_numbered_list(json_response, mock_logger):
+    """Test malformed or non-list JSON falls back to a numbered-list query."""
+    client = JSONClient(json_response)
+
+    prompts = generate_prompts("Samsung", "samsung.com", 3, client, mock_logger)
+
+    assert prompts == NUMBERED_PROMPTS
+    assert len(client.json_queries) == 1
+    assert len(client.queries) == 1
+    mock_logger.warning.assert_called()
+
+
+def test_parse_json_prompts_skips_blank_and_non_string_questions():
+    """Test only non-empty string questions are kept, stripped."""
+    response = json.dumps({"questions": [" Best phone? ", "", None, 7, "Best TV?"]})
+
+    assert _parse_json_prompts(response) == ["Best phone?", "Best TV?"]
+
+
+def test_parse_numbered_prompts_strips_numbering():
+    """Test list numbering and blank lines are removed."""
+    assert _parse_numbered_prompts(NUMBERED_RESPONSE) == NUMBERED_PROMPTS
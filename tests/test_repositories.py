@@ -0,0 +1,205 @@
+"""Unit tests for database repositories."""
+
+from unittest.mock import Mock, patch
+
+from db.models import Brand, Metric, Prompt, Response
+from db.repositories import MetricsRepository, PromptRepository, ResponseRepository
+
+
+def _metric_row(brand_id, llm_name, mention_rate=0.5):
+    """Build one upsert_many row."""
+    return {
+        "brand_id": brand_id,
+        "llm_name": llm_name,
+        "mention_rate": mention_rate,
+        "citations_list": [{"url": "samsung.com", "percentage": 50.0}],
+        "sentiment_score": 60.0,
+        "brand_rank": 1.5,
+    }
+
+
+def test_upsert_many_inserts_new_metrics(db_session, brand):
+    """Test new (brand_id, llm_name) pairs are inserted and returned."""
+    rows = [
+        _metric_row(brand.brand_id, "chatgpt"),
+        _metric_row(brand.brand_id, "gemini"),
+    ]
+
+    metrics = MetricsRepository.upsert_many(db_session, rows)
+
+    assert sorted(m.llm_name for m in metrics) == ["chatgpt", "gemini"]
+    assert all(m.metric_id is not None for m in metrics)
+    assert db_session.query(Metric).count() == 2
+    chatgpt = next(m for m in metrics if m.llm_name == "chatgpt")
+    assert chatgpt.citations_list == [{"url": "samsung.com", "percentage": 50.0}]
+    assert chatgpt.brand_rank == 1.5
+
+
+def test_upsert_many_updates_existing_metric(db_session, brand):
+    """Test a conflicting (brand_id, llm_name) row is updated in place."""
+    (first,) = MetricsRepository.upsert_many(
+        db_session, [_metric_row(brand.brand_id, "chatgpt", mention_rate=0.1)]
+    )
+    metric_id, created_at = first.metric_id, first.created_at
+
+    (second,) = MetricsRepository.upsert_many(
+        db_session, [_metric_row(brand.brand_id, "chatgpt", mention_rate=0.9)]
+    )
+
+    assert second.metric_id == metric_id
+    assert second.mention_rate == 0.9
+    assert second.created_at == created_at
+    assert second.updated_at >= created_at
+    assert db_session.query(Metric).count() == 1
+
+
+def test_upsert_many_refreshes_metrics_in_session(db_session, brand):
+    """Test Metric objects already in the session see the updated values."""
+    (metric,) = MetricsRepository.upsert_many(
+        db_session, [_metric_row(brand.brand_id, "chatgpt", mention_rate=0.1)]
+    )
+
+    MetricsRepository.upsert_many(
+        db_session, [_metric_row(brand.brand_id, "chatgpt", mention_rate=0.9)]
+    )
+
+    # Same identity, refreshed without an explicit expire/refresh
+    assert metric.mention_rate == 0.9
+    assert MetricsRepository.get_by_brand(db_session, brand.brand_id) == [metric]
+
+
+def test_upsert_many_without_rows(db_session):
+    """Test an empty batch is a no-op."""
+    assert MetricsRepository.upsert_many(db_session, []) == []
+
+
+def test_upsert_many_falls_back_to_per_row_upsert():
+    """Test dialects without ON CONFLICT upsert one row at a time."""
+    db_session = Mock()
+    db_session.get_bind.return_value.dialect.name = "mysql"
+    rows = [_metric_row("brand", "chatgpt"), _metric_row("brand", "gemini")]
+
+    with patch.object(MetricsRepository, "upsert", side_effect=["m1", "m2"]) as upsert:
+        assert MetricsRepository.upsert_many(db_session, rows) == ["m1", "m2"]
+
+    assert [c.kwargs["llm_name"] for c in upsert.call_args_list] == [
+        "chatgpt",
+        "gemini",
+    ]
+    db_session.scalars.assert_not_called()
+
+
+def _batch_sizes(mock_method):
+    """Number of parameter rows passed to each call of a spied session method."""
+    return [len(c.args[1]) for c in mock_method.call_args_list]
+
+
+def test_prompt_create_bulk_preserves_input_order(db_session, brand):
+    """Test prompts come back in input order across 500-row INSERT batches."""
+    texts = [f"Question {i}?" for i in reversed(range(1001))]
+
+    with patch.object(db_session, "scalars", wraps=db_session.scalars) as scalars:
+        prompts = PromptRepository.create_bulk(db_session, brand.brand_id, texts)
+
+    assert _batch_sizes(scalars) == [500, 500, 1]
+    assert [p.prompt for p in prompts] == texts
+    assert all(p.brand_id == brand.brand_id for p in prompts)
+    assert len({p.prompt_id for p in prompts}) == 1001
+    assert db_session.query(Prompt).count() == 1001
+
+
+def test_prompt_create_bulk_exact_batch_multiple(db_session, brand):
+    """Test a multiple of the batch size issues no trailing empty INSERT."""
+    texts = [f"Question {i}?" for i in range(1000)]
+
+    with patch.object(db_session, "scalars", wraps=db_session.scalars) as scalars:
+        prompts = PromptRepository.create_bulk(db_session, brand.brand_id, texts)
+
+    assert _batch_sizes(scalars) == [500, 500]
+    assert [p.prompt for p in prompts] == texts
+
+
+def test_prompt_create_bulk_without_prompts(db_session, brand):
+    """Test an empty prompt list runs no INSERT."""
+    with patch.object(db_session, "scalars", wraps=db_session.scalars) as scalars:
+        assert PromptRepository.create_bulk(db_session, brand.brand_id, []) == []
+
+    scalars.assert_not_called()
+
+
+def test_response_create_bulk_inserts_in_batches(db_session, brand):
+    """Test responses from a generator are inserted 500 rows at a time."""
+    (prompt,) = PromptRepository.create_bulk(db_session, brand.brand_id, ["Q?"])
+    rows = (
+        {
+            "prompt_id": prompt.prompt_id,
+            "llm_name": "chatgpt",
+            "answer": f"Answer {i}",
+            "brands_list": ["Samsung"],
+            "citation_list": [],
+        }
+        for i in range(1001)
+    )
+
+    with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+        created = ResponseRepository.create_bulk(db_session, rows)
+
+    assert created == 1001
+    assert _batch_sizes(execute) == [500, 500, 1]
+    answers = {r.answer for r in db_session.query(Response).all()}
+    assert answers == {f"Answer {i}" for i in range(1001)}
+
+
+def test_response_create_bulk_without_rows(db_session):
+    """Test an empty row iterable runs no INSERT."""
+    with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+        assert ResponseRepository.create_bulk(db_session, iter([])) == 0
+
+    execute.assert_not_called()
+
+
+def _store_responses(db_session, brand_id, count):
+    """Store ``count`` responses, one per prompt, for a brand."""
+    texts = [f"{brand_id} question {i}?" for i in range(count)]
+    prompts = PromptRepository.create_bulk(db_session, brand_id, texts)
+    ResponseRepository.create_bulk(
+        db_session,
+        (
+            {
+                "prompt_id": prompt.prompt_id,
+                "llm_name": "chatgpt",
+                "answer": f"Answer {i}",
+                "brands_list": ["Samsung"],
+                "citation_list": [],
+            }
+            for i, prompt in enumerate(prompts)
+        ),
+    )
+
+
+def test_iter_batches_by_brand_yields_partitions(db_session, brand):
+    """Test a brand's responses are yielded in batches of batch_size."""
+    other = Brand(name="Apple", website="apple.com")
+    db_session.add(other)
+    db_session.flush()
+    _store_responses(db_session, brand.brand_id, 5)
+    _store_responses(db_session, other.brand_id, 3)
+
+    batches = list(
+        ResponseRepository.iter_batches_by_brand(db_session, brand.brand_id, 2)
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    answers = sorted(r.answer for batch in batches for r in batch)
+    assert answers == [f"Answer {i}" for i in range(5)]
+    other_answers = sorted(
+        r.answer for r in ResponseRepository.iter_by_brand(db_session, other.brand_id)
+    )
+    assert other_answers == ["Answer 0", "Answer 1", "Answer 2"]
+
+
+def test_iter_batches_by_brand_without_responses(db_session, brand):
+    """Test a brand without responses yields no batches."""
+    assert (
+        list(ResponseRepository.iter_batches_by_brand(db_session, brand.brand_id)) == []
+    )
@@ -0,0 +1,77 @@
+"""Unit tests for response processing."""
+
+from db.models import Prompt, Response
+from services.response_processor import process_responses
+
+
+def _response(prompt, answer="Samsung is great", **overrides):
+    """Build one response dict as returned by the LLM query phase."""
+    response = {
+        "prompt": prompt,
+        "answer": answer,
+        "brands_list": ["Samsung", "Apple"],
+        "citation_list": ["https://samsung.com"],
+        "error": None,
+    }
+    response.update(overrides)
+    return response
+
+
+def test_process_responses_stores_prompts_and_responses(db_session, brand, mock_logger):
+    """Test one prompt row per unique prompt text and one row per response."""
+    llm_responses = {
+        "chatgpt": [_response("Best phone?"), _response("Best laptop?")],
+        "gemini": [
+            _response("Best phone?", answer="Apple is great"),
+            _response("Best laptop?", answer="", error="timeout"),
+        ],
+    }
+
+    process_responses(db_session, brand.brand_id, llm_responses, mock_logger)
+
+    prompts = {p.prompt: p.prompt_id for p in db_session.query(Prompt).all()}
+    assert set(prompts) == {"Best phone?", "Best laptop?"}
+
+    stored = {(r.llm_name, r.prompt_id): r for r in db_session.query(Response).all()}
+    assert set(stored) == {
+        ("chatgpt", prompts["Best phone?"]),
+        ("chatgpt", prompts["Best laptop?"]),
+        ("gemini", prompts["Best phone?"]),
+    }
+    gemini = stored[("gemini", prompts["Best phone?"])]
+    assert gemini.answer == "Apple is great"
+    assert gemini.brands_list == ["Samsung", "Apple"]
+    assert gemini.citation_list == ["https://samsung.com"]
+
+
+def test_process_responses_skips_malformed_response(db_session, brand, mock_logger):
+    """Test a malformed response is skipped without failing the other rows."""
+    llm_responses = {
+        "chatgpt": [
+            _response("Best phone?"),
+            _response("Best laptop?", brands_list=None),
+        ],
+        "gemini": [
+            _response("Best tablet?", citation_list=[{"url": "https://x.com"}]),
+            _response("Best phone?", answer="Apple is great"),
+        ],
+    }
+
+    process_responses(db_session, brand.brand_id, llm_responses, mock_logger)
+
+    assert {p.prompt for p in db_session.query(Prompt).all()} == {"Best phone?"}
+    assert sorted(r.llm_name for r in db_session.query(Response).all()) == [
+        "chatgpt",
+        "gemini",
+    ]
+    assert mock_logger.error.call_count == 2
+
+
+def test_process_responses_without_successful_responses(db_session, brand, mock_logger):
+    """Test nothing is written when every response failed."""
+    llm_responses = {"chatgpt": [_response("Best phone?", answer="", error="timeout")]}
+
+    process_responses(db_session, brand.brand_id, llm_responses, mock_logger)
+
+    assert db_session.query(Prompt).count() == 0
+    assert db_session.query(Response).count() == 0
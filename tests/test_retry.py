@@ -0,0 +1,85 @@
+"""Unit tests for retry logic."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils.retry import retry_with_backoff
+
+
+def _flaky(failures, exc_type=TimeoutError):
+    """Build a callable that raises ``failures`` times, then returns "ok"."""
+    errors = [exc_type(f"attempt {i + 1}") for i in range(failures)]
+    return Mock(side_effect=[*errors, "ok"])
+
+
+@patch("utils.retry.time.sleep")
+def test_retry_succeeds_after_failures(mock_sleep):
+    """Test the call is retried until it succeeds within max_attempts."""
+    func = _flaky(2)
+    wrapped = retry_with_backoff(max_attempts=3, exceptions=(TimeoutError,))(func)
+
+    assert wrapped("prompt", timeout=5) == "ok"
+    assert func.call_count == 3
+    func.assert_called_with("prompt", timeout=5)
+    assert mock_sleep.call_count == 2
+
+
+@patch("utils.retry.time.sleep")
+def test_retry_first_success_does_not_sleep(mock_sleep):
+    """Test a call that succeeds first time is made once, with no wait."""
+    func = _flaky(0)
+    wrapped = retry_with_backoff(exceptions=(TimeoutError,))(func)
+
+    assert wrapped() == "ok"
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("utils.retry.time.sleep")
+def test_retry_reraises_last_exception(mock_sleep):
+    """Test the last exception propagates once attempts run out."""
+    func = _flaky(3)
+    wrapped = retry_with_backoff(max_attempts=3, exceptions=(TimeoutError,))(func)
+
+    with pytest.raises(TimeoutError, match="attempt 3"):
+        wrapped()
+    assert func.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("utils.retry.time.sleep")
+def test_retry_does_not_retry_other_exceptions(mock_sleep):
+    """Test exceptions outside ``exceptions`` propagate immediately."""
+    func = _flaky(1, exc_type=ValueError)
+    wrapped = retry_with_backoff(max_attempts=3, exceptions=(TimeoutError,))(func)
+
+    with pytest.raises(ValueError, match="attempt 1"):
+        wrapped()
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("utils.retry.time.sleep")
+def test_retry_wait_schedule_is_clamped(mock_sleep):
+    """Test waits double per attempt, clamped to [min_wait, max_wait]."""
+    func = _flaky(6)
+    wrapped = retry_with_backoff(
+        max_attempts=6, min_wait=2, max_wait=10, exceptions=(TimeoutError,)
+    )(func)
+
+    with pytest.raises(TimeoutError):
+        wrapped()
+    # 2 ** (n - 1) = 1, 2, 4, 8, 16 -> clamped to 2, 2, 4, 8, 10
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 2, 4, 8, 10]
+
+
+def test_retry_preserves_function_metadata():
+    """Test the wrapper keeps the wrapped function's name and docstring."""
+
+    @retry_with_backoff()
+    def query():
+        """Send a query."""
+
+    assert query.__name__ == "query"
+    assert query.__doc__ == "Send a query."
@@ -0,0 +1,177 @@
+"""Unit tests for Slack notifications."""
+
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+
+from services.slack_service import (
+    _json_escape,
+    _log_unexpected_error,
+    send_slack_notification,
+    send_slack_notification_async,
+)
+
+WEBHOOK_URL = "https://hooks.slack.com/services/T000/B000/XXXX"
+
+
+class StubResponse:
+    """Streamed webhook response with a fixed status and body."""
+
+    def __init__(self, status_code=200, body=b"ok"):
+        self.status_code = status_code
+        self.content = body
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+
+class StubSession:
+    """Session recording posted webhooks instead of sending them."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response or StubResponse()
+        self.error = error
+        self.posts = []
+
+    def post(self, url, **kwargs):
+        self.posts.append((url, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def test_send_slack_notification_async_posts_through_session(mock_logger):
+    """Test the notification is posted on the executor via the given session."""
+    session = StubSession()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = send_slack_notification_async(
+            executor,
+            WEBHOOK_URL,
+            "Samsung",
+            "user@example.com",
+            mock_logger,
+            timeout=5,
+            session=session,
+        )
+        assert future.result(timeout=5) is True
+
+    ((url, kwargs),) = session.posts
+    assert url == WEBHOOK_URL
+    assert kwargs["timeout"] == 5
+    assert kwargs["stream"] is True
+    assert session.response.closed
+    mock_logger.error.assert_not_called()
+
+
+def test_send_slack_notification_async_reports_failure(mock_logger):
+    """Test request errors resolve the future to False without raising."""
+    session = StubSession(error=requests.exceptions.ConnectionError("refused"))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = send_slack_notification_async(
+            executor,
+            WEBHOOK_URL,
+            "Samsung",
+            "user@example.com",
+            mock_logger,
+            session=session,
+        )
+        assert future.result(timeout=5) is False
+
+    mock_logger.warning.assert_called_once()
+    mock_logger.error.assert_not_called()
+
+
+def test_send_slack_notification_async_logs_unexpected_error(mock_logger):
+    """Test an unexpected worker exception is logged by the done callback."""
+    session = StubSession(error=ValueError("bad header"))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = send_slack_notification_async(
+            executor,
+            WEBHOOK_URL,
+            "Samsung",
+            "user@example.com",
+            mock_logger,
+            session=session,
+        )
+        assert isinstance(future.exception(timeout=5), ValueError)
+
+    mock_logger.error.assert_called_once()
+    assert "bad header" in mock_logger.error.call_args.args[0]
+
+
+def test_log_unexpected_error_logs_exception(mock_logger):
+    """Test an exception raised by the worker is logged."""
+    future = Future()
+    future.set_exception(RuntimeError("boom"))
+
+    _log_unexpected_error(future, mock_logger)
+
+    mock_logger.error.assert_called_once()
+    assert "boom" in mock_logger.error.call_args.args[0]
+
+
+def test_log_unexpected_error_ignores_result(mock_logger):
+    """Test a completed notification logs nothing."""
+    future = Future()
+    future.set_result(False)
+
+    _log_unexpected_error(future, mock_logger)
+
+    mock_logger.error.assert_not_called()
+
+
+def _posted_payload(session):
+    """Decode the JSON body of the single webhook posted through a stub session."""
+    ((_, kwargs),) = session.posts
+    return json.loads(kwargs["data"].decode("utf-8"))
+
+
+def test_send_slack_notification_payload(mock_logger):
+    """Test the templated payload matches the Slack message structure."""
+    session = StubSession()
+
+    assert send_slack_notification(
+        WEBHOOK_URL, "Samsung", "user@example.com", mock_logger, session=session
+    )
+
+    ((_, kwargs),) = session.posts
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
+    payload = _posted_payload(session)
+    assert payload["text"] == "New Brand Insight Request: Samsung (user@example.com)"
+    header, section = payload["blocks"]
+    assert header["text"]["text"] == "🎯 New Brand Insight Request"
+    assert section["text"]["text"] == (
+        "*Brand Name:* Samsung\n*Email:* user@example.com"
+    )
+
+
+def test_send_slack_notification_escapes_brand_name(mock_logger):
+    """Test quotes, backslashes, percent signs and non-ASCII survive escaping."""
+    brand_name = 'Café "Ünïcode" 東京 \\ 100%'
+    session = StubSession()
+
+    assert send_slack_notification(
+        WEBHOOK_URL, brand_name, "o'brien@example.com", mock_logger, session=session
+    )
+
+    payload = _posted_payload(session)
+    assert payload["text"] == (
+        f"New Brand Insight Request: {brand_name} (o'brien@example.com)"
+    )
+    assert payload["blocks"][1]["text"]["text"] == (
+        f"*Brand Name:* {brand_name}\n*Email:* o'brien@example.com"
+    )
+
+
+def test_json_escape_round_trips():
+    """Test escaped strings decode back to the original inside a JSON literal."""
+    for value in ['say "hi"', "back\\slash", "line\nbreak", "Ünïcode 東京", ""]:
+        assert json.loads(f'"{_json_escape(value)}"') == value
@@ -0,0 +1,39 @@
+"""Unit tests for text utilities."""
+
+import pytest
+
+from utils.text_utils import _normalize_brand_name_uncached, normalize_brand_name
+
+
+@pytest.mark.parametrize(
+    "brand, expected",
+    [
+        ("  Samsung™  ", "samsung"),
+        ("Apple®", "apple"),
+        ("OnePlus.", "oneplus"),
+        ("Procter  &\tGamble", "procter & gamble"),
+        ("samsung galaxy", "samsung galaxy"),
+        ("oneplus.", "oneplus"),
+        ("apple ", "apple"),
+    ],
+)
+def test_normalize_brand_name(brand, expected):
+    """Test trademark symbols, whitespace and trailing punctuation are removed."""
+    assert normalize_brand_name(brand) == expected
+    assert _normalize_brand_name_uncached(brand) == expected
+
+
+def test_normalize_brand_name_is_cached():
+    """Test repeated normalizations are served from the cache."""
+    normalize_brand_name.cache_clear()
+    normalize_brand_name("Samsung")
+    normalize_brand_name("Samsung")
+
+    info = normalize_brand_name.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_normalize_brand_name_interns_results():
+    """Test spellings of the same brand normalize to one shared string."""
+    assert normalize_brand_name("Samsung") is normalize_brand_name("  SAMSUNG™ ")
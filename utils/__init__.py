@@ -1,11 +1,12 @@
 """Utility modules."""
 
-from utils.logger import get_logger
+from utils.logger import configure_logging, get_logger
 from utils.timing import timing_decorator
 from utils.retry import retry_with_backoff
 from utils.text_utils import normalize_brand_name
 
 __all__ = [
+    "configure_logging",
     "get_logger",
     "timing_decorator",
     "retry_with_backoff",
@@ -0,0 +1,27 @@
+"""Utilities for processing iterables in fixed-size batches."""
+
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most ``size`` items.
+
+    Items are pulled lazily, so only one batch is held in memory at a time.
+
+    Args:
+        items: Items to split
+        size: Maximum batch size (must be positive)
+
+    Yields:
+        Consecutive batches, the last one possibly shorter
+
+    Examples:
+        >>> list(chunked([1, 2, 3, 4, 5], 2))
+        [[1, 2], [3, 4], [5]]
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
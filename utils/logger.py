@@ -1,13 +1,109 @@
 """Structured logging configuration."""
 
 import logging
+import os
 import sys
-from typing import Optional
+import time
+from typing import Any, Optional
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# When set, log_with_context is a no-op for the whole process; updated by
+# configure_logging
+_quiet = False
+
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter producing ``_LOG_FORMAT`` lines without %-interpolation.
+
+    strftime only has second resolution, so the date part of the timestamp
+    is rendered once per second and reused for every record logged within
+    that second; milliseconds are appended per record when no ``datefmt``
+    is given, as ``logging.Formatter.formatTime`` does.
+    """
+
+    def __init__(self, datefmt: Optional[str] = None) -> None:
+        """Initialize formatter.
+
+        Args:
+            datefmt: Optional strftime format for the timestamp
+        """
+        super().__init__(_LOG_FORMAT, datefmt=datefmt)
+        # (epoch second, strftime output); one tuple so it swaps atomically
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record exactly as ``logging.Formatter(_LOG_FORMAT)`` would."""
+        second = int(record.created)
+        cached_second, date_text = self._cached_time
+        if second != cached_second:
+            date_text = time.strftime(
+                self.datefmt or self.default_time_format,
+                self.converter(record.created),
+            )
+            self._cached_time = (second, date_text)
+
+        if self.datefmt:
+            asctime = date_text
+        else:
+            # Same as the default_msec_format "%s,%03d"
+            asctime = f"{date_text},{int(record.msecs):03d}"
+
+        record.message = record.getMessage()
+        record.asctime = asctime
+        text = f"{asctime} - {record.name} - {record.levelname} - {record.message}"
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += record.exc_text
+        if record.stack_info:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += self.formatStack(record.stack_info)
+        return text
+
+
+def configure_logging(level: str, quiet: Optional[bool] = None) -> None:
+    """Configure process-wide logging (called once from ``create_app``).
+
+    Module loggers propagate to a single stdout handler on the root logger
+    rather than each owning one. As with ``logging.basicConfig``, no handler
+    is added if the root logger already has one.
+
+    Args:
+        level: Log level name (e.g., "INFO")
+        quiet: Turn ``log_with_context`` into a no-op; if None, taken from
+            the BRANK_QUIET environment variable
+    """
+    global _quiet
+    if quiet is None:
+        quiet = bool(os.environ.get("BRANK_QUIET"))
+    _quiet = quiet
+
+    root = logging.getLogger()
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(FastFormatter())
+        root.addHandler(handler)
+    root.setLevel(getattr(logging, level.upper()))
 
 
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """Get configured logger instance.
-    
+
+    Output goes through the root handler set up by ``configure_logging``.
+
     Args:
         name: Logger name (typically __name__)
         level: Optional log level override
@@ -16,20 +112,8 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         Configured Logger instance
     """
     logger = logging.getLogger(name)
-
     if level:
         logger.setLevel(getattr(logging, level.upper()))
-
-    # Add handler if not already present
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
     return logger
 
 
@@ -37,18 +121,32 @@ def log_with_context(
     logger: logging.Logger,
     level: str,
     message: str,
-    **context,
+    **context: Any,
 ) -> None:
     """Log message with structured context.
-    
+
+    The context is only formatted into the message when the logger is
+    enabled for ``level``, so suppressed calls cost a single level check.
+    Context values are rendered with ``str()``. Nothing is logged when quiet
+    mode is enabled by ``configure_logging``.
+
     Args:
         logger: Logger instance
-        level: Log level (info, warning, error, etc.)
+        level: Log level (info, warning, error, etc.); lowercase names are
+            looked up directly, other casings are lowercased first
         message: Log message
         **context: Additional context as keyword arguments
     """
-    log_method = getattr(logger, level.lower())
+    if _quiet:
+        return
+
+    level_no = _LEVELS.get(level)
+    if level_no is None:
+        level_no = _LEVELS[level.lower()]
+    if not logger.isEnabledFor(level_no):
+        return
+
     context_str = " | ".join(f"{k}={v}" for k, v in context.items())
     full_message = f"{message} | {context_str}" if context else message
-    log_method(full_message)
+    logger.log(level_no, full_message)
 
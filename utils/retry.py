@@ -1,12 +1,11 @@
 """Retry logic with exponential backoff."""
 
-from typing import Type, Tuple, Callable
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+import time
+from functools import wraps
+from typing import Callable, ParamSpec, Tuple, Type, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
 
 
 def retry_with_backoff(
@@ -14,27 +13,42 @@ def retry_with_backoff(
     min_wait: int = 2,
     max_wait: int = 10,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-) -> Callable:
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator for retrying functions with exponential backoff.
-    
+
+    The wait after the n-th failed attempt is 2 ** (n - 1) seconds, clamped
+    to [min_wait, max_wait]. Exceptions outside ``exceptions`` propagate
+    immediately, and the last exception is re-raised once attempts run out.
+    A call that succeeds first time runs no retry bookkeeping at all.
+
     Args:
         max_attempts: Maximum number of retry attempts
         min_wait: Minimum wait time in seconds
         max_wait: Maximum wait time in seconds
         exceptions: Tuple of exception types to retry on
-        
+
     Returns:
         Retry decorator
-        
+
     Example:
         @retry_with_backoff(max_attempts=3, exceptions=(TimeoutError,))
         def call_external_api():
             # ... code that might timeout ...
     """
-    return retry(
-        stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-        retry=retry_if_exception_type(exceptions),
-        reraise=True,
-    )
 
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            attempt = 1
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except exceptions:
+                    if attempt >= max_attempts:
+                        raise
+                time.sleep(max(min_wait, min(2 ** (attempt - 1), max_wait)))
+                attempt += 1
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,24 @@
 """Text processing utilities."""
 
-import re
+import sys
+from functools import lru_cache
 
+# Deletes trademark symbols in a single C-level pass via str.translate
+_TRADEMARK_TABLE = str.maketrans("", "", "™®©")
 
+
+@lru_cache(maxsize=8192)
 def normalize_brand_name(brand: str) -> str:
     """Normalize brand name for comparison.
 
+    Results are memoized: brand names have low cardinality but are
+    normalized for every response they appear in. Use
+    ``_normalize_brand_name_uncached`` to bypass the cache.
+
+    Results are also interned, so spellings that normalize to the same name
+    ("Samsung", "SAMSUNG™") share one string object and the dict lookups on
+    normalized names in the metrics calculator compare by identity.
+
     Args:
         brand: Brand name to normalize
 
@@ -16,11 +29,29 @@ def normalize_brand_name(brand: str) -> str:
         >>> normalize_brand_name("  Samsung™  ")
         'samsung'
     """
+    return sys.intern(_normalize_brand_name_uncached(brand))
+
+
+def _normalize_brand_name_uncached(brand: str) -> str:
+    """Normalize brand name without memoization (see normalize_brand_name)."""
+    # Fast path: clean lowercase ASCII names ("samsung", "procter & gamble")
+    # are already normalized. Non-printable characters cover all the
+    # whitespace str.split() would collapse other than the plain space.
+    if (
+        brand.isascii()
+        and brand.islower()
+        and brand.isprintable()
+        and "  " not in brand
+        and brand[0] != " "
+        and brand[-1] not in " .,;:!?"
+    ):
+        return brand
+
     # Convert to lowercase
     normalized = brand.lower()
 
     # Remove trademark symbols and other special chars
-    normalized = re.sub(r"[™®©]", "", normalized)
+    normalized = normalized.translate(_TRADEMARK_TABLE)
 
     # Remove extra whitespace
     normalized = " ".join(normalized.split())
@@ -29,4 +60,3 @@ def normalize_brand_name(brand: str) -> str:
     normalized = normalized.rstrip(".,;:!?")
 
     return normalized.strip()
-
@@ -8,7 +8,10 @@ from typing import Callable, Any
 
 def timing_decorator(logger: logging.Logger) -> Callable:
     """Decorator to measure and log function execution time.
-    
+
+    Durations come from the monotonic ``time.perf_counter_ns`` clock, so
+    wall-clock adjustments cannot skew them.
+
     Args:
         logger: Logger instance to use for logging
         
@@ -24,17 +27,17 @@ def timing_decorator(logger: logging.Logger) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 logger.info(
                     f"{func.__name__} completed in {duration:.3f}s",
                     extra={"duration_seconds": duration, "function": func.__name__},
                 )
                 return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 logger.error(
                     f"{func.__name__} failed after {duration:.3f}s: {e}",
                     extra={"duration_seconds": duration, "function": func.__name__},
@@ -48,7 +51,10 @@ def timing_decorator(logger: logging.Logger) -> Callable:
 
 class Timer:
     """Context manager for timing code blocks.
-    
+
+    ``start`` and ``end`` are ``time.perf_counter_ns`` readings;
+    ``elapsed`` is in seconds.
+
     Example:
         with Timer() as t:
             # ... expensive code ...
@@ -57,17 +63,17 @@ class Timer:
 
     def __init__(self):
         """Initialize timer."""
-        self.start: float = 0.0
-        self.end: float = 0.0
+        self.start: int = 0
+        self.end: int = 0
         self.elapsed: float = 0.0
 
     def __enter__(self):
         """Start timer."""
-        self.start = time.time()
+        self.start = time.perf_counter_ns()
         return self
 
     def __exit__(self, *args):
         """Stop timer and calculate elapsed time."""
-        self.end = time.time()
-        self.elapsed = self.end - self.start
+        self.end = time.perf_counter_ns()
+        self.elapsed = (self.end - self.start) / 1e9
 
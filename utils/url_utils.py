@@ -1,10 +1,15 @@
 """URL utilities for domain extraction."""
 
+from functools import lru_cache
 from urllib.parse import urlparse
 
 
+@lru_cache(maxsize=65536)
 def extract_domain(url: str) -> str:
     """Extract domain from URL.
+
+    Results are memoized: the same citation URLs recur heavily across
+    responses and LLMs, so each unique URL is only parsed once.
     
     Args:
         url: Full URL
@@ -18,6 +23,34 @@ def extract_domain(url: str) -> str:
         >>> extract_domain("http://www.example.com/path")
         "http://example.com"
     """
+    # Fast path for the overwhelmingly common "http(s)://host/..." shape:
+    # slice the host out with str.find instead of building a ParseResult
+    if url.startswith("https://"):
+        scheme, host_start = "https", 8
+    elif url.startswith("http://"):
+        scheme, host_start = "http", 7
+    else:
+        scheme = ""
+
+    if scheme:
+        host_end = len(url)
+        for delimiter in "/?#":
+            position = url.find(delimiter, host_start)
+            if position != -1 and position < host_end:
+                host_end = position
+        netloc = url[host_start:host_end]
+        # Anything urlparse would treat specially (IPv6 brackets, non-ASCII
+        # or control characters) goes through the full parser below
+        if (
+            netloc.isascii()
+            and netloc.isprintable()
+            and "[" not in netloc
+            and "]" not in netloc
+        ):
+            if netloc.startswith("www."):
+                netloc = netloc[4:]
+            return f"{scheme}://{netloc}"
+
     try:
         parsed = urlparse(url)
         